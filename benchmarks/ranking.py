@@ -0,0 +1,187 @@
+"""
+Benchmark how many issue checks (i.e. ai calls) are needed per stale/free issue found,
+when checking issue's by creation date compared to ranking them by likelihood first.
+
+Uses the verdicts from a results file written by an ai mode run (with --output). Synthetic
+issue's labelled by the simple mode can be used instead (with --synthetic) to check the
+benchmark runs, but the ranking weights encode the simple mode's rules, so the result is
+self-fulfilling and says nothing about the ai calls saved.
+
+Usage:
+    python benchmarks/ranking.py results.jsonl [--prompt-counts 1 5 10 25]
+"""
+
+import random
+from argparse import ArgumentParser
+from datetime import datetime, timedelta
+
+from github_issue_prompter.ranking import likelihood_score
+from github_issue_prompter.sinks import load_results
+from github_issue_prompter.status import _check_simple
+from github_issue_prompter.types import (
+    Issue,
+    IssueCheckMode,
+    IssueComment,
+    ResultSource,
+    Status,
+)
+
+
+HITS = [Status.STALE, Status.FREE]
+
+
+def synthetic_issues(
+    count: int, seed: int = 0
+) -> tuple[list[Issue], dict[str, Status]]:
+    """
+    Generate random issue's, labelled by the simple mode.
+
+    Parameters
+    ----------
+    count : int
+    seed : int = 0
+
+    Returns
+    -------
+    tuple[list[Issue], dict[str, Status]]
+        The issue's, and the status of each issue.
+    """
+    _random = random.Random(seed)
+    now = datetime.now()
+
+    issues = []
+    for number in range(1, count + 1):
+        created = now - timedelta(days=_random.uniform(30, 365))
+        comments = sorted(
+            [
+                IssueComment(
+                    author=_random.choice(["author", "assignee", "someone"]),
+                    body=_random.choice(["any update?", "i'm working on it", "+1"]),
+                    # most busy issues have had recent activity
+                    updated=now - timedelta(days=_random.expovariate(1 / 7)),
+                )
+                for _ in range(_random.choice([0, 1, 2, 3, 5, 5, 5, 5, 5, 5]))
+            ],
+            key=lambda _c: _c.updated,
+            reverse=True,
+        )
+        issues.append(
+            Issue(
+                organisation="org",
+                repository="repo",
+                number=number,
+                title="issue",
+                author="author",
+                body="",
+                created=created,
+                updated=comments[0].updated if comments else created,
+                assignees=_random.choice([[], ["assignee"], ["assignee"]]),
+                comments=comments,
+            )
+        )
+
+    labels = {repr(_i): Status(_check_simple(issue=_i).status) for _i in issues}
+    return issues, labels
+
+
+def recorded_issues(
+    path: str,
+) -> tuple[list[Issue], dict[str, Status], dict[str, datetime]]:
+    """
+    Load the issue's, and their ai mode verdicts, from a results file.
+
+    Only verdicts the ai mode actually gave (not from a checkpoint or a duplicate) are
+    used, and if an issue was checked by more than one run, only it's latest verdict.
+
+    Parameters
+    ----------
+    path : str
+
+    Returns
+    -------
+    tuple[list[Issue], dict[str, Status], dict[str, datetime]]
+        The issue's, the status of each issue, and when each issue was checked.
+    """
+    issues, labels, checked = {}, {}, {}
+    for result in load_results(path=path):
+        if (
+            result["mode"] == str(IssueCheckMode.AI)
+            and result["source"] == str(ResultSource.CHECKED)
+            and result["status"] != str(Status.ERROR)
+        ):
+            issue = Issue.from_dict(result["data"])
+            issues[repr(issue)] = issue
+            labels[repr(issue)] = Status(result["status"])
+            checked[repr(issue)] = datetime.fromisoformat(result["started"])
+    return list(issues.values()), labels, checked
+
+
+def checks_needed(
+    issues: list[Issue], labels: dict[str, Status], prompt_count: int
+) -> int:
+    """The number of issue's checked, in the given order, before prompt_count are found."""
+    found = 0
+    for checked, issue in enumerate(issues, start=1):
+        found += labels[repr(issue)] in HITS
+        if found == prompt_count:
+            return checked
+    return len(issues)
+
+
+def main():
+    parser = ArgumentParser(
+        description="Benchmark checks per hit, with and without ranking."
+    )
+    parser.add_argument("results", nargs="?", help="Results file from an ai mode run.")
+    parser.add_argument(
+        "--synthetic",
+        action="store_true",
+        help="Use synthetic issue's labelled by the simple mode (self-fulfilling).",
+    )
+    parser.add_argument(
+        "--issues", type=int, default=2000, help="Synthetic issue count."
+    )
+    parser.add_argument("--prompt-counts", type=int, nargs="+", default=[1, 5, 10, 25])
+    args = parser.parse_args()
+
+    if args.results:
+        issues, labels, checked = recorded_issues(path=args.results)
+    elif args.synthetic:
+        print(
+            "WARNING: synthetic issue's are labelled by the simple mode, whose rules the "
+            "ranking weights encode, so ranking looks perfect. Use an ai mode results "
+            "file to measure the ai calls saved."
+        )
+        issues, labels = synthetic_issues(count=args.issues)
+        checked = {repr(_i): datetime.now() for _i in issues}
+    else:
+        parser.error("a results file from an ai mode run (or --synthetic) is required")
+
+    hits = sum(1 for _s in labels.values() if _s in HITS)
+    print(f"{len(issues)} issues, {hits} stale or free")
+    print(
+        f"{'prompt count':>12} | {'by created':>10} | {'ranked':>6} | {'checks per hit':>16}"
+    )
+
+    by_created = sorted(issues, key=lambda _i: _i.created)
+    # score each issue as it was when checked, like `rank_issues` would have during the run
+    scores = {
+        repr(_i): likelihood_score(issue=_i, now=checked[repr(_i)]) for _i in issues
+    }
+    ranked = sorted(
+        by_created, key=lambda _i: (-scores[repr(_i)], _i.created, repr(_i))
+    )
+    for prompt_count in args.prompt_counts:
+        if prompt_count > hits:
+            continue
+
+        before = checks_needed(by_created, labels, prompt_count)
+        after = checks_needed(ranked, labels, prompt_count)
+        print(
+            f"{prompt_count:>12} | {before:>10} | {after:>6} | "
+            f"{before / prompt_count:>6.2f} -> {after / prompt_count:<6.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Benchmark the cold-start import time of the `prompt` command, using `python -X importtime`.
+
+Fails (exits non-zero) if starting up is slower than the allowed time, or if any module that
+should only be loaded on demand (e.g. the OpenAI SDK) is imported at startup.
+
+Usage:
+    python benchmarks/startup.py [--max-ms 250] [--runs 5]
+"""
+
+import statistics
+import subprocess
+import sys
+from argparse import ArgumentParser
+
+
+# what the `prompt` entry point (and simple mode) imports before parsing arguments
+STARTUP_CODE = "import github_issue_prompter.command, github_issue_prompter.status"
+
+# modules that must only be imported once the mode that needs them is chosen
+LAZY_MODULES = ["openai", "github_issue_prompter.status_ai"]
+
+
+def measure_startup(code: str) -> tuple[float, set[str]]:
+    """
+    Import the startup modules in a fresh interpreter, and measure the time taken.
+
+    Parameters
+    ----------
+    code : str
+
+    Returns
+    -------
+    tuple[float, set[str]]
+        The total import time (in milliseconds), and the names of every module imported.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    total_us = 0
+    modules = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        modules.add(name.strip())
+        if not name.startswith("  "):
+            total_us += int(
+                cumulative
+            )  # only count top-level imports, to avoid double counting
+
+    return total_us / 1000, modules
+
+
+def main():
+    parser = ArgumentParser(
+        description="Benchmark the cold-start time of the prompt command."
+    )
+    parser.add_argument(
+        "--max-ms", type=float, default=250, help="Slowest allowed startup."
+    )
+    parser.add_argument(
+        "--runs", type=int, default=5, help="How many times to measure."
+    )
+    args = parser.parse_args()
+
+    timings = []
+    modules: set[str] = set()
+    for _ in range(args.runs):
+        timing, modules = measure_startup(code=STARTUP_CODE)
+        timings.append(timing)
+
+    median = statistics.median(timings)
+    print(f"startup import time: median {median:.1f}ms, min {min(timings):.1f}ms")
+
+    failed = False
+    eager = [m for m in LAZY_MODULES if m in modules]
+    if eager:
+        print(f"FAIL: modules imported at startup that should be lazy: {eager}")
+        failed = True
+
+    if median > args.max_ms:
+        print(f"FAIL: startup is slower than the allowed {args.max_ms:.0f}ms")
+        failed = True
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,60 @@
-from github_issue_prompter.prompter import prompt_issues
-from github_issue_prompter.types import Issue, IssueCheckMode, IssueComment, IssueStatus
+from typing import TYPE_CHECKING, Any
+
+from github_issue_prompter.budget import BudgetGovernor, BudgetLimits
+from github_issue_prompter.manifest import (
+    Manifest,
+    ManifestTarget,
+    load_manifest,
+    prompt_manifest,
+)
+from github_issue_prompter.prompter import iter_prompt_issues, prompt_issues
+from github_issue_prompter.sinks import (
+    CallbackSink,
+    JSONLSink,
+    ResultSink,
+    SQLiteSink,
+    get_sink,
+)
+from github_issue_prompter.types import (
+    Issue,
+    IssueCheckMode,
+    IssueComment,
+    IssueResult,
+    IssueStatus,
+)
+
+
+if TYPE_CHECKING:
+    from github_issue_prompter.classifier import train_local_classifier
 
 
 __all__ = [
     "prompt_issues",
+    "iter_prompt_issues",
+    "prompt_manifest",
+    "load_manifest",
+    "train_local_classifier",
+    "Manifest",
+    "ManifestTarget",
+    "BudgetGovernor",
+    "BudgetLimits",
     "Issue",
     "IssueCheckMode",
     "IssueComment",
+    "IssueResult",
     "IssueStatus",
+    "ResultSink",
+    "JSONLSink",
+    "SQLiteSink",
+    "CallbackSink",
+    "get_sink",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # the local mode is only imported when used, so importing the package stays fast
+    if name == "train_local_classifier":
+        from github_issue_prompter.classifier import train_local_classifier
+
+        return train_local_classifier
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
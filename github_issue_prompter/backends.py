@@ -0,0 +1,78 @@
+from dataclasses import dataclass
+from importlib import import_module
+from typing import Any, Callable
+
+from github_issue_prompter.types import IssueCheckMode
+
+
+@dataclass(frozen=True)
+class Backend:
+    """
+    Class to store where the implementation of an issue check mode lives.
+
+    Implementations are given as "module:attribute" paths and only imported when first
+    used, so a mode's dependencies (e.g. the OpenAI SDK) are only loaded if it's chosen.
+    """
+
+    check: str  # the function to check an issue's status
+    client: str | None = None  # a factory for the client used by check, given a token
+
+
+_BACKENDS: dict[IssueCheckMode, Backend] = {
+    IssueCheckMode.SIMPLE: Backend(
+        check="github_issue_prompter.status:_check_simple",
+    ),
+    IssueCheckMode.AI: Backend(
+        check="github_issue_prompter.status_ai:_check_ai",
+        client="github_issue_prompter.status_ai:create_client",
+    ),
+    IssueCheckMode.LOCAL: Backend(
+        check="github_issue_prompter.classifier:_check_local",
+    ),
+}
+
+
+def register_backend(mode: IssueCheckMode, backend: Backend) -> None:
+    """
+    Register (or replace) the backend used to implement an issue check mode.
+
+    Parameters
+    ----------
+    mode : IssueCheckMode
+    backend : Backend
+    """
+    _BACKENDS[mode] = backend
+
+
+def get_backend(mode: IssueCheckMode) -> Backend:
+    """
+    Get the backend used to implement an issue check mode, without importing it.
+
+    Parameters
+    ----------
+    mode : IssueCheckMode
+
+    Returns
+    -------
+    Backend
+    """
+    try:
+        return _BACKENDS[IssueCheckMode(mode)]
+    except KeyError:
+        raise NotImplementedError(f"Unsupported IssueCheckMode was provided: {mode}")
+
+
+def load(path: str) -> Callable[..., Any]:
+    """
+    Import an attribute given as a "module:attribute" path.
+
+    Parameters
+    ----------
+    path : str
+
+    Returns
+    -------
+    Callable[..., Any]
+    """
+    module, _, attribute = path.partition(":")
+    return getattr(import_module(module), attribute)
@@ -0,0 +1,168 @@
+import logging
+import threading
+import time
+from dataclasses import dataclass
+
+from github_issue_prompter.types import BudgetExhaustedAction
+
+
+logger = logging.getLogger(__name__)
+
+
+class BudgetExhaustedError(Exception):
+    def __init__(self, message: str, organisation: str | None = None):
+        super().__init__(message)
+        self.organisation = organisation  # None if the whole run's budget is exhausted
+
+
+@dataclass
+class BudgetLimits:
+    """Class to store the limits on what can be spent checking issue's with the ai mode."""
+
+    max_tokens: int | None = None
+    max_requests: int | None = None
+    max_seconds: float | None = None
+
+
+@dataclass
+class BudgetSpend:
+    """Class to store what has been spent checking issue's with the ai mode."""
+
+    requests: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    started: float | None = None  # monotonic time spending started
+
+    @property
+    def total_tokens(self) -> int:
+        return self.prompt_tokens + self.completion_tokens
+
+    @property
+    def seconds(self) -> float:
+        return time.monotonic() - self.started if self.started is not None else 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"{self.requests} requests, {self.total_tokens} tokens "
+            f"({self.prompt_tokens} prompt, {self.completion_tokens} completion), "
+            f"{self.seconds:.0f} seconds"
+        )
+
+
+class BudgetGovernor:
+    """
+    Class to track and limit the tokens, requests and time spent by the ai mode.
+
+    Limits can be set for the whole run, and for each organisation. Once a limit is
+    reached, issue's are either checked with the simple mode instead, or the run (or
+    organisation) is stopped, depending on the chosen action.
+    """
+
+    def __init__(
+        self,
+        run_limits: BudgetLimits | None = None,
+        organisation_limits: BudgetLimits | None = None,
+        on_exhausted: BudgetExhaustedAction | str = BudgetExhaustedAction.STOP,
+    ):
+        self.run_limits = run_limits or BudgetLimits()
+        self.organisation_limits = organisation_limits or BudgetLimits()
+        self.on_exhausted = BudgetExhaustedAction(on_exhausted)
+
+        # each spend's clock starts on first use, so time spent querying GitHub isn't counted
+        self.spend = BudgetSpend()
+        self.organisation_spend: dict[str, BudgetSpend] = {}
+        self._lock = threading.Lock()
+        self._warned: set[str | None] = set()
+
+    @staticmethod
+    def _started(spend: BudgetSpend) -> BudgetSpend:
+        if spend.started is None:
+            spend.started = time.monotonic()
+        return spend
+
+    def _organisation(self, organisation: str) -> BudgetSpend:
+        return self._started(
+            self.organisation_spend.setdefault(organisation, BudgetSpend())
+        )
+
+    def record(
+        self,
+        organisation: str,
+        prompt_tokens: int = 0,
+        completion_tokens: int = 0,
+    ) -> None:
+        """
+        Record an ai request made for an organisation's issue, and the tokens it used.
+
+        Parameters
+        ----------
+        organisation : str
+        prompt_tokens : int = 0
+        completion_tokens : int = 0
+            The tokens used, if the response reported its usage.
+        """
+        with self._lock:
+            for spend in [self._started(self.spend), self._organisation(organisation)]:
+                spend.requests += 1
+                spend.prompt_tokens += prompt_tokens
+                spend.completion_tokens += completion_tokens
+
+    @staticmethod
+    def _exceeded(spend: BudgetSpend, limits: BudgetLimits) -> str | None:
+        if limits.max_tokens is not None and spend.total_tokens >= limits.max_tokens:
+            return f"token limit of {limits.max_tokens}"
+        if limits.max_requests is not None and spend.requests >= limits.max_requests:
+            return f"request limit of {limits.max_requests}"
+        if limits.max_seconds is not None and spend.seconds >= limits.max_seconds:
+            return f"time limit of {limits.max_seconds} seconds"
+        return None
+
+    def check(self, organisation: str) -> None:
+        """
+        Check there is budget remaining to make an ai request for an organisation's issue.
+
+        Parameters
+        ----------
+        organisation : str
+
+        Raises
+        ------
+        BudgetExhaustedError
+            If the run or organisation has reached one of its limits.
+        """
+        with self._lock:
+            run_limit = self._exceeded(self._started(self.spend), self.run_limits)
+            organisation_limit = self._exceeded(
+                self._organisation(organisation), self.organisation_limits
+            )
+
+        if run_limit:
+            error = BudgetExhaustedError(f"The run has reached its {run_limit}.")
+        elif organisation_limit:
+            error = BudgetExhaustedError(
+                f"Organisation {organisation} has reached its {organisation_limit}.",
+                organisation=organisation,
+            )
+        else:
+            return
+
+        if error.organisation not in self._warned:
+            self._warned.add(error.organisation)
+            logger.warning(
+                "%s %s",
+                error,
+                (
+                    "Stopping."
+                    if self.on_exhausted == BudgetExhaustedAction.STOP
+                    else "Checking issues with the simple mode instead."
+                ),
+            )
+        raise error
+
+    def summary(self) -> str:
+        """A summary of what has been spent, in total and by organisation."""
+        lines = [f"ai mode spend: {self.spend}"]
+        lines.extend(
+            f"\t{_org}: {_spend}" for _org, _spend in self.organisation_spend.items()
+        )
+        return "\n".join(lines)
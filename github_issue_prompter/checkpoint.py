@@ -0,0 +1,202 @@
+import json
+import logging
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any
+
+from github_issue_prompter.types import Issue, IssueStatus, Status
+
+
+logger = logging.getLogger(__name__)
+
+
+class Checkpoint:
+    """
+    Class to record the progress of a run to a local state file, so it can be resumed.
+
+    Progress is appended to the file (as json lines) as soon as it's made: each page of
+    repositories and issue's queried (with the cursor of the next page), and each issue
+    status checked. Resuming replays the file, so the run continues exactly where it stopped,
+    any partially written last line is ignored (and removed, so it isn't appended to).
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        run: dict[str, Any],
+        resume: bool = False,
+    ):
+        """
+        Parameters
+        ----------
+        path : str | Path
+        run : dict[str, Any]
+            The arguments identifying the run, a checkpoint can only resume the same run.
+        resume : bool = False
+            Whether to resume from the existing state file, or start a new one.
+        """
+        self.path = Path(path)
+        self.run = run
+
+        self.repositories: dict[str, dict[str, Any]] = {}  # organisation -> progress
+        self.issues: dict[str, dict[str, Any]] = {}  # org/repo -> progress
+        self.results: dict[str, IssueStatus] = {}  # org/repo/issues/number -> status
+
+        if resume:
+            if not self.path.exists():
+                raise ValueError(f"Cannot resume, no checkpoint found at: {self.path}")
+            self._load()
+        else:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text("")
+            self._append({"type": "run", "run": run})
+
+    def _load(self) -> None:
+        content = self.path.read_text()
+        if content and not content.endswith("\n"):
+            # remove the partial last line, so the next entry isn't appended onto it
+            with self.path.open("r+") as file:
+                file.truncate(len(content[: content.rfind("\n") + 1].encode()))
+
+        for line in content.splitlines():
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                logger.warning("Ignoring partially written checkpoint entry: %s", line)
+                continue
+
+            match entry["type"]:
+                case "run":
+                    if entry["run"] != self.run:
+                        raise ValueError(
+                            f"Cannot resume, the checkpoint at {self.path} is for a "
+                            f"different run: {entry['run']}"
+                        )
+                case "repositories":
+                    self._update_repositories(
+                        organisation=entry["data"]["organisation"],
+                        names=entry["data"]["names"],
+                        cursor=entry["data"]["cursor"],
+                        done=entry["data"]["done"],
+                    )
+                case "issues":
+                    self._update_issues(
+                        repository=entry["data"]["repository"],
+                        issues=[Issue.from_dict(_i) for _i in entry["data"]["issues"]],
+                        cursor=entry["data"]["cursor"],
+                        done=entry["data"]["done"],
+                    )
+                case "result":
+                    self.results[entry["data"]["issue"]] = IssueStatus(
+                        status=Status(entry["data"]["status"]["status"]),
+                        reason=entry["data"]["status"]["reason"],
+                        comment=entry["data"]["status"]["comment"],
+                    )
+
+        logger.info(
+            "Resuming from checkpoint %s: %s repositories and %s issues already checked.",
+            self.path,
+            sum(1 for _i in self.issues.values() if _i["done"]),
+            len(self.results),
+        )
+
+    def _append(self, entry: dict[str, Any]) -> None:
+        with self.path.open("a") as file:
+            file.write(json.dumps(entry) + "\n")
+
+    def _update_repositories(
+        self,
+        organisation: str,
+        names: list[str],
+        cursor: str | None,
+        done: bool,
+    ) -> None:
+        progress = self.repositories.setdefault(
+            organisation, {"names": [], "cursor": None, "done": False}
+        )
+        progress["names"].extend(names)
+        progress["cursor"] = cursor
+        progress["done"] = done
+
+    def _update_issues(
+        self,
+        repository: str,
+        issues: list[Issue],
+        cursor: str | None,
+        done: bool,
+    ) -> None:
+        progress = self.issues.setdefault(
+            repository, {"issues": [], "cursor": None, "done": False}
+        )
+        progress["issues"].extend(issues)
+        progress["cursor"] = cursor
+        progress["done"] = done
+
+    def record_repositories(
+        self,
+        organisation: str,
+        names: list[str],
+        cursor: str | None,
+        has_next_page: bool,
+    ) -> None:
+        """Record a page of repositories queried for an organisation."""
+        self._update_repositories(
+            organisation=organisation,
+            names=names,
+            cursor=cursor,
+            done=not has_next_page,
+        )
+        self._append(
+            {
+                "type": "repositories",
+                "data": {
+                    "organisation": organisation,
+                    "names": names,
+                    "cursor": cursor,
+                    "done": not has_next_page,
+                },
+            }
+        )
+
+    def record_issues(
+        self,
+        repository: str,
+        issues: list[Issue],
+        cursor: str | None,
+        has_next_page: bool,
+    ) -> None:
+        """Record a page of issue's queried for a repository (given as org/repo)."""
+        self._update_issues(
+            repository=repository,
+            issues=issues,
+            cursor=cursor,
+            done=not has_next_page,
+        )
+        self._append(
+            {
+                "type": "issues",
+                "data": {
+                    "repository": repository,
+                    "issues": [_i.to_dict() for _i in issues],
+                    "cursor": cursor,
+                    "done": not has_next_page,
+                },
+            }
+        )
+
+    def record_result(
+        self,
+        issue: Issue,
+        status: IssueStatus,
+    ) -> None:
+        """Record the checked status of an issue."""
+        self.results[repr(issue)] = status
+        self._append(
+            {
+                "type": "result",
+                "data": {
+                    "issue": repr(issue),
+                    "status": {**asdict(status), "status": str(status.status)},
+                },
+            }
+        )
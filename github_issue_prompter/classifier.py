@@ -0,0 +1,283 @@
+import json
+import logging
+import math
+import random
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+
+from github_issue_prompter.constants import DEFAULT_LOCAL_MODEL
+from github_issue_prompter.features import FEATURE_NAMES, issue_features
+from github_issue_prompter.sinks import load_results
+from github_issue_prompter.status import prompt_comment
+from github_issue_prompter.types import (
+    Issue,
+    IssueCheckMode,
+    IssueStatus,
+    ResultSource,
+    Status,
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+# the statuses the local model can predict
+CLASSES = [Status.ACTIVE, Status.STALE, Status.FREE]
+
+
+class LocalClassifier:
+    """
+    Class for a small multinomial logistic regression model, over issue activity features.
+
+    Pure python and CPU-only, so it can check thousands of issue's per second in-process.
+    Trained to reproduce the verdicts previously given by the ai mode.
+    """
+
+    def __init__(
+        self,
+        weights: list[list[float]] | None = None,
+        bias: list[float] | None = None,
+        means: list[float] | None = None,
+        scales: list[float] | None = None,
+    ):
+        n_features = len(FEATURE_NAMES)
+        self.weights = weights or [[0.0] * n_features for _ in CLASSES]
+        self.bias = bias or [0.0] * len(CLASSES)
+        self.means = means or [0.0] * n_features
+        self.scales = scales or [1.0] * n_features
+
+    def _standardise(self, features: list[float]) -> list[float]:
+        return [(_f - _m) / _s for _f, _m, _s in zip(features, self.means, self.scales)]
+
+    def _probabilities(self, features: list[float]) -> list[float]:
+        logits = [
+            _b + sum(_w * _x for _w, _x in zip(weights, features))
+            for weights, _b in zip(self.weights, self.bias)
+        ]
+        top = max(logits)
+        exps = [math.exp(_l - top) for _l in logits]
+        total = sum(exps)
+        return [_e / total for _e in exps]
+
+    def predict_proba(self, features: list[float]) -> dict[Status, float]:
+        """The probability of each status, given an issue's features."""
+        probabilities = self._probabilities(self._standardise(features))
+        return dict(zip(CLASSES, probabilities))
+
+    def predict(self, features: list[float]) -> tuple[Status, float]:
+        """The most likely status given an issue's features, and its probability."""
+        probabilities = self.predict_proba(features)
+        status = max(probabilities, key=lambda _s: probabilities[_s])
+        return status, probabilities[status]
+
+    def fit(
+        self,
+        features: list[list[float]],
+        labels: list[Status],
+        epochs: int = 500,
+        learning_rate: float = 0.5,
+        l2: float = 0.001,
+    ) -> "LocalClassifier":
+        """
+        Train the model with full-batch gradient descent.
+
+        Parameters
+        ----------
+        features : list[list[float]]
+        labels : list[Status]
+        epochs : int = 500
+        learning_rate : float = 0.5
+        l2 : float = 0.001
+            The strength of the l2 regularisation applied to the weights.
+
+        Returns
+        -------
+        LocalClassifier
+            The trained model (self).
+        """
+        n_samples, n_features = len(features), len(FEATURE_NAMES)
+
+        # standardise the features, so they're on a similar scale
+        self.means = [sum(_col) / n_samples for _col in zip(*features)]
+        self.scales = [
+            math.sqrt(sum((_x - _m) ** 2 for _x in _col) / n_samples) or 1.0
+            for _col, _m in zip(zip(*features), self.means)
+        ]
+        inputs = [self._standardise(_f) for _f in features]
+        targets = [CLASSES.index(_l) for _l in labels]
+
+        for _ in range(epochs):
+            grad_w = [[0.0] * n_features for _ in CLASSES]
+            grad_b = [0.0] * len(CLASSES)
+
+            for x, target in zip(inputs, targets):
+                probabilities = self._probabilities(x)
+                for k, probability in enumerate(probabilities):
+                    error = probability - (1.0 if k == target else 0.0)
+                    grad_b[k] += error
+                    for j, value in enumerate(x):
+                        grad_w[k][j] += error * value
+
+            for k in range(len(CLASSES)):
+                self.bias[k] -= learning_rate * grad_b[k] / n_samples
+                for j in range(n_features):
+                    self.weights[k][j] -= learning_rate * (
+                        grad_w[k][j] / n_samples + l2 * self.weights[k][j]
+                    )
+
+        return self
+
+    def save(self, path: str | Path) -> None:
+        """Save the trained model to a json file."""
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        Path(path).write_text(
+            json.dumps(
+                {
+                    "features": FEATURE_NAMES,
+                    "classes": [str(_c) for _c in CLASSES],
+                    "weights": self.weights,
+                    "bias": self.bias,
+                    "means": self.means,
+                    "scales": self.scales,
+                }
+            )
+        )
+
+    @classmethod
+    def load(cls, path: str | Path) -> "LocalClassifier":
+        """Load a trained model from a json file created by `save`."""
+        data = json.loads(Path(path).read_text())
+        if data["features"] != FEATURE_NAMES:
+            raise ValueError(
+                f"The local model at {path} was trained with different features, "
+                f"it must be re-trained: {data['features']}"
+            )
+        return cls(
+            weights=data["weights"],
+            bias=data["bias"],
+            means=data["means"],
+            scales=data["scales"],
+        )
+
+
+def train_local_classifier(
+    results: str | Path,
+    model_path: str | Path = DEFAULT_LOCAL_MODEL,
+    holdout: float = 0.2,
+    seed: int = 0,
+) -> float:
+    """
+    Train the local model from ai mode verdicts previously written to a results file.
+
+    A share of the verdicts are held out to measure how often the trained model agrees
+    with the ai mode, before the model is re-trained on every verdict and saved.
+
+    Parameters
+    ----------
+    results : str | Path
+        A json lines or SQLite file written by a result sink.
+    model_path : str | Path = DEFAULT_LOCAL_MODEL
+        Where to save the trained model.
+    holdout : float = 0.2
+        The fraction of verdicts held out to measure agreement, between 0 and 1.
+    seed : int = 0
+        Used to randomly (but repeatably) choose the held out verdicts.
+
+    Returns
+    -------
+    float
+        The fraction of held out verdicts the model agrees with.
+    """
+    if not 0 < holdout < 1:
+        raise ValueError(f"The holdout must be between 0 and 1, given: {holdout}")
+
+    features, labels = [], []
+    for result in load_results(path=results):
+        if (
+            result["mode"] != str(IssueCheckMode.AI)
+            or result["source"] != str(ResultSource.CHECKED)
+            or result["status"] not in [str(_c) for _c in CLASSES]
+        ):
+            continue  # only learn from verdicts actually given by the ai mode
+
+        issue = Issue.from_dict(result["data"])
+        now = datetime.fromisoformat(result["started"])  # features as the ai saw them
+        features.append(issue_features(issue=issue, now=now))
+        labels.append(Status(result["status"]))
+
+    if len(features) < 10:
+        raise ValueError(
+            f"At least 10 ai mode verdicts are needed to train the local model, "
+            f"found {len(features)} in: {results}"
+        )
+
+    order = list(range(len(features)))
+    random.Random(seed).shuffle(order)
+    n_holdout = max(1, int(len(order) * holdout))
+    test, train = order[:n_holdout], order[n_holdout:]
+
+    model = LocalClassifier().fit(
+        features=[features[_i] for _i in train],
+        labels=[labels[_i] for _i in train],
+    )
+    agreement = sum(
+        1 for _i in test if model.predict(features[_i])[0] == labels[_i]
+    ) / len(test)
+
+    logger.info(
+        "Local model agrees with %.1f%% of %s held out ai verdicts (trained on %s).",
+        agreement * 100,
+        len(test),
+        len(train),
+    )
+
+    # use every verdict for the saved model
+    LocalClassifier().fit(features=features, labels=labels).save(path=model_path)
+    logger.info(
+        "Saved local model trained on %s ai verdicts to %s.", len(features), model_path
+    )
+
+    return agreement
+
+
+@lru_cache
+def _load_model(model_path: str) -> LocalClassifier:
+    return LocalClassifier.load(path=model_path)
+
+
+def _check_local(
+    issue: Issue,
+    model_path: str = DEFAULT_LOCAL_MODEL,
+    **_,
+) -> IssueStatus:
+    """
+    Determine whether an Issue is stale, active or free, using the locally trained model.
+
+    Parameters
+    ----------
+    issue: Issue
+        Object detailing all necessary issue information to check its status.
+    model_path: str = DEFAULT_LOCAL_MODEL
+        The trained model to use, created by `train_local_classifier`.
+    **_
+        Unused kwargs.
+
+    Returns
+    -------
+    IssueStatus
+        An object detailing the current status of the issue, along with a reason
+        and a comment that can be used to prompt the issue.
+    """
+    status, probability = _load_model(model_path=str(model_path)).predict(
+        features=issue_features(issue=issue)
+    )
+    reason = (
+        f"The local model predicts the issue is {status} ({probability:.0%} likely)."
+    )
+
+    return IssueStatus(
+        status=status,
+        reason=reason,
+        comment=prompt_comment(issue=issue, status=status),
+    )
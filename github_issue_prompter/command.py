@@ -2,13 +2,24 @@ import logging
 import os
 from argparse import ArgumentParser
 
+from github_issue_prompter.budget import BudgetGovernor, BudgetLimits
 from github_issue_prompter.constants import (
+    DEFAULT_CHECKPOINT,
+    DEFAULT_COMMENT_JOURNAL,
+    DEFAULT_LOCAL_MODEL,
+    PROMPTER_COMMENT_JOURNAL,
     PROMPTER_GITHUB_TOKEN,
     PROMPTER_LOG_LEVEL,
     PROMPTER_OPENAI_TOKEN,
 )
+from github_issue_prompter.manifest import prompt_manifest
 from github_issue_prompter.prompter import prompt_issues
-from github_issue_prompter.types import IssueCheckMode, PostCommentsOptions
+from github_issue_prompter.sinks import get_sink
+from github_issue_prompter.types import (
+    BudgetExhaustedAction,
+    IssueCheckMode,
+    PostCommentsOptions,
+)
 
 
 # some basic config for logging to the terminal
@@ -59,6 +70,19 @@ parser.add_argument(
     action="store_true",
     help="Simple issue check mode, for testing or if you don't have access to the OpenAI API.",
 )
+parser.add_argument(
+    "-l",
+    "--local",
+    action="store_true",
+    help="Local issue check mode, using a model trained from previous ai mode results "
+    "(see prompt-train).",
+)
+parser.add_argument(
+    "--model-path",
+    type=str,
+    default=DEFAULT_LOCAL_MODEL,
+    help="The trained model to use in local mode.",
+)
 parser.add_argument(
     "-c",
     "--prompt-count",
@@ -81,6 +105,70 @@ parser.add_argument(
     action="store_true",
     help="Whether to only prompt issue's that are assigned.",
 )
+parser.add_argument(
+    "-d",
+    "--dedupe",
+    action="store_true",
+    help="Find near-duplicate issue's, so each group of duplicates is only checked once.",
+)
+parser.add_argument(
+    "--rank",
+    action="store_true",
+    help="Check the issue's most likely to be stale or free first, to find the "
+    "prompt count with fewer checks.",
+)
+parser.add_argument(
+    "--budget-tokens",
+    type=int,
+    default=None,
+    help="The maximum number of tokens the ai mode can use.",
+)
+parser.add_argument(
+    "--budget-requests",
+    type=int,
+    default=None,
+    help="The maximum number of requests the ai mode can make.",
+)
+parser.add_argument(
+    "--budget-seconds",
+    type=float,
+    default=None,
+    help="The maximum time (in seconds) the ai mode can be used for.",
+)
+parser.add_argument(
+    "--on-budget-exhausted",
+    type=BudgetExhaustedAction,
+    choices=list(BudgetExhaustedAction),
+    default=BudgetExhaustedAction.STOP,
+    help="Whether to stop, or continue with the simple mode, once an ai mode budget is used up.",
+)
+parser.add_argument(
+    "-j",
+    "--comment-journal",
+    type=str,
+    default=None,
+    help="File recording posted comments, so re-runs never comment on an issue twice. "
+    f"If None will default to {PROMPTER_COMMENT_JOURNAL}, or {DEFAULT_COMMENT_JOURNAL}.",
+)
+parser.add_argument(
+    "--checkpoint",
+    type=str,
+    default=DEFAULT_CHECKPOINT,
+    help="File to record the run's progress to, so it can be resumed if it stops.",
+)
+parser.add_argument(
+    "--resume",
+    action="store_true",
+    help="Resume the run recorded in the checkpoint file, from where it stopped.",
+)
+parser.add_argument(
+    "--output",
+    type=str,
+    action="append",
+    default=[],
+    help="File to stream each issue's result to as it's checked, either json lines "
+    "(.jsonl) or SQLite (.db, .sqlite). Can be given multiple times.",
+)
 
 
 def main():
@@ -89,6 +177,140 @@ def main():
     kwargs = vars(args)
 
     simple = kwargs.pop("simple")
-    kwargs["mode"] = IssueCheckMode.SIMPLE if simple else IssueCheckMode.AI
+    local = kwargs.pop("local")
+    if simple and local:
+        parser.error("Only one of --simple or --local can be chosen.")
+    kwargs["mode"] = (
+        IssueCheckMode.SIMPLE
+        if simple
+        else IssueCheckMode.LOCAL if local else IssueCheckMode.AI
+    )
+
+    limits = BudgetLimits(
+        max_tokens=kwargs.pop("budget_tokens"),
+        max_requests=kwargs.pop("budget_requests"),
+        max_seconds=kwargs.pop("budget_seconds"),
+    )
+    on_exhausted = kwargs.pop("on_budget_exhausted")
+    if limits != BudgetLimits():
+        kwargs["budget"] = BudgetGovernor(run_limits=limits, on_exhausted=on_exhausted)
+
+    sinks = [get_sink(path=_p) for _p in kwargs.pop("output")]
+    try:
+        prompt_issues(sinks=sinks, **kwargs)
+    finally:
+        for sink in sinks:
+            sink.close()
+
+
+# build manifest parser
+manifest_parser = ArgumentParser(
+    prog="prompt-manifest",
+    description="Prompt stale issue's across every target listed in a manifest file.",
+)
+
+
+# add the arguments of `prompt_manifest`
+manifest_parser.add_argument(
+    "manifest",
+    help="Path to the TOML, YAML or JSON manifest file listing the targets to prompt.",
+)
+manifest_parser.add_argument(
+    "-g",
+    "--github-token",
+    type=str,
+    default=None,
+    help="The GitHub API token to use when querying or making comments. "
+    f"If None will default to {PROMPTER_GITHUB_TOKEN}.",
+)
+manifest_parser.add_argument(
+    "-o",
+    "--openai-token",
+    type=str,
+    default=None,
+    help="The OpenAI API token to use (if any target uses ai mode). "
+    f"If None will default to {PROMPTER_OPENAI_TOKEN}.",
+)
+manifest_parser.add_argument(
+    "-m",
+    "--max-prompts",
+    type=int,
+    default=None,
+    help="How many issue's should be prompted across all targets, overrides the manifest.",
+)
+manifest_parser.add_argument(
+    "-j",
+    "--comment-journal",
+    type=str,
+    default=None,
+    help="File recording posted comments, so re-runs never comment on an issue twice. "
+    f"If None will default to {PROMPTER_COMMENT_JOURNAL}, or {DEFAULT_COMMENT_JOURNAL}.",
+)
+manifest_parser.add_argument(
+    "--checkpoint",
+    type=str,
+    default=DEFAULT_CHECKPOINT,
+    help="File to record the run's progress to, so it can be resumed if it stops.",
+)
+manifest_parser.add_argument(
+    "--resume",
+    action="store_true",
+    help="Resume the run recorded in the checkpoint file, from where it stopped.",
+)
+manifest_parser.add_argument(
+    "--output",
+    type=str,
+    action="append",
+    default=[],
+    help="File to stream each issue's result to as it's checked, either json lines "
+    "(.jsonl) or SQLite (.db, .sqlite). Can be given multiple times.",
+)
+
+
+def manifest_main():
+    """Check and prompt some issues, for every target in a manifest!"""
+    args = manifest_parser.parse_args()
+    kwargs = vars(args)
+
+    sinks = [get_sink(path=_p) for _p in kwargs.pop("output")]
+    try:
+        prompt_manifest(sinks=sinks, **kwargs)
+    finally:
+        for sink in sinks:
+            sink.close()
+
+
+# build train parser
+train_parser = ArgumentParser(
+    prog="prompt-train",
+    description="Train the local issue check mode's model, from previous ai mode results.",
+)
+
+
+# add the arguments of `train_local_classifier`
+train_parser.add_argument(
+    "results",
+    help="The json lines or SQLite results file, written by an ai mode run with --output.",
+)
+train_parser.add_argument(
+    "-m",
+    "--model-path",
+    type=str,
+    default=DEFAULT_LOCAL_MODEL,
+    help="Where to save the trained model.",
+)
+train_parser.add_argument(
+    "--holdout",
+    type=float,
+    default=0.2,
+    help="The fraction of ai verdicts held out to measure the model's agreement with them.",
+)
+
+
+def train_main():
+    """Train the local model, and report how well it agrees with the ai mode!"""
+    # imported here, so the local mode isn't loaded by the other commands
+    from github_issue_prompter.classifier import train_local_classifier
 
-    prompt_issues(**kwargs)
+    args = train_parser.parse_args()
+    train_local_classifier(**vars(args))  # logs the agreement
@@ -0,0 +1,269 @@
+import json
+import logging
+import re
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timedelta
+from hashlib import sha256
+from pathlib import Path
+
+import requests
+
+from github_issue_prompter.github_rest import (
+    GitHubCommentsAPIError,
+    GitHubCommentsRateLimitError,
+    comment_on_github_issue,
+)
+from github_issue_prompter.types import Issue
+
+
+logger = logging.getLogger(__name__)
+
+
+_TORN_ISSUE = re.compile(r'"issue": "([^"]+)"')
+
+
+class CommentJournal:
+    """
+    Class to persistently record the comments posted to issues, so they're only posted once.
+
+    Each attempt is written to the journal (as a json line) before the comment is posted,
+    and again once the outcome is known. An attempt without an outcome (e.g. the process was
+    killed mid-request, or the request's outcome is unknown) is treated as posted, as it's
+    safer to miss a comment than to double-post.
+
+    Comment's are generated per run (so differ between runs), so an issue is considered
+    commented on for a window of time after the comment, rather than by the comment's hash.
+    Once the window has passed the issue can be prompted again, e.g. if it's gone stale again.
+    The comment hash records which comment was posted.
+    """
+
+    def __init__(self, path: str | Path, window: timedelta | None = timedelta(days=30)):
+        """
+        Parameters
+        ----------
+        path : str | Path
+        window : timedelta | None = timedelta(days=30)
+            How long after a comment the issue isn't commented on again, None for forever.
+        """
+        self.path = Path(path)
+        self.window = window
+        self._lock = threading.Lock()
+        # issue -> (comment hash, state, time)
+        self._entries: dict[str, tuple[str, str, datetime]] = {}
+
+        if self.path.exists():
+            self._load()
+
+    def _load(self) -> None:
+        content = self.path.read_text()
+
+        for line in content.splitlines():
+            if not line.strip():
+                continue
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                # written as the process was killed, so the comment may have been posted
+                logger.warning("Partially written comment journal entry: %s", line)
+                if torn := _TORN_ISSUE.search(line):
+                    self._entries[torn.group(1)] = ("", "pending", datetime.now())
+                continue
+            self._entries[entry["issue"]] = (
+                entry["hash"],
+                entry["state"],
+                datetime.fromisoformat(entry["time"]),
+            )
+
+        if content and not content.endswith("\n"):
+            # remove the partial last line, so the next entry isn't appended onto it
+            with self.path.open("r+") as file:
+                file.truncate(len(content[: content.rfind("\n") + 1].encode()))
+
+    @staticmethod
+    def comment_hash(comment: str) -> str:
+        return sha256(comment.encode()).hexdigest()
+
+    def has_posted(self, issue: Issue) -> bool:
+        """Whether a comment has been (or may have been) posted to the issue, in the window."""
+        with self._lock:
+            entry = self._entries.get(repr(issue))
+
+        if entry is None or entry[1] == "failed":
+            return False
+        return self.window is None or entry[2] > datetime.now() - self.window
+
+    def record(self, issue: Issue, comment: str, state: str) -> None:
+        """
+        Append an entry to the journal, flushed to disk before returning.
+
+        Parameters
+        ----------
+        issue : Issue
+        comment : str
+        state : str
+            One of "pending", "posted", "uncertain" or "failed".
+        """
+        now = datetime.now()
+        entry = {
+            "issue": repr(issue),
+            "hash": self.comment_hash(comment),
+            "state": state,
+            "time": now.isoformat(),
+        }
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("a") as file:
+                file.write(json.dumps(entry) + "\n")
+            self._entries[entry["issue"]] = (entry["hash"], state, now)
+
+
+class CommentPoster:
+    """
+    Class to post comments to GitHub issues in the background, so checking isn't blocked.
+
+    Comments are posted with bounded concurrency, paced to stay under GitHub's secondary
+    rate-limits for content creation, and retried after any requested backoff.
+    """
+
+    def __init__(
+        self,
+        token: str,
+        journal: CommentJournal | None = None,
+        max_workers: int = 4,
+        min_interval: float = 1.0,
+        max_retries: int = 3,
+    ):
+        self.token = token
+        self.journal = journal
+        self.min_interval = min_interval
+        self.max_retries = max_retries
+
+        self.posted = 0
+        self.skipped = 0
+        self.failed = 0
+        self.uncertain = 0  # the request failed, so the comment may have been posted
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="prompter-comments",
+        )
+        self._pace_lock = threading.Lock()
+        self._count_lock = threading.Lock()
+        self._next_post = 0.0
+        self._submitted: set[str] = set()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def submit(self, issue: Issue, comment: str) -> Future[bool]:
+        """
+        Queue a comment to be posted to an issue.
+
+        Parameters
+        ----------
+        issue : Issue
+        comment : str
+
+        Returns
+        -------
+        Future[bool]
+            Resolves to True if the comment was posted, False if it was skipped or failed.
+        """
+        future = self._executor.submit(self._post, issue, comment)
+        future.add_done_callback(self._log_error)
+        return future
+
+    def close(self, wait: bool = True) -> None:
+        """Stop accepting comments, waiting for any queued comments to be posted."""
+        self._executor.shutdown(wait=wait)
+        logger.info(
+            "Comment posting finished: %s posted, %s skipped, %s failed, %s uncertain.",
+            self.posted,
+            self.skipped,
+            self.failed,
+            self.uncertain,
+        )
+
+    @staticmethod
+    def _log_error(future: Future[bool]) -> None:
+        """Log any unexpected error posting a comment, as nothing else reads the future."""
+        if not future.cancelled() and (error := future.exception()) is not None:
+            logger.error("Unexpected error posting a comment.", exc_info=error)
+
+    def _pace(self) -> None:
+        """Block until enough time has passed since the last comment was posted."""
+        with self._pace_lock:
+            delay = self._next_post - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            self._next_post = time.monotonic() + self.min_interval
+
+    def _count(self, outcome: str) -> None:
+        with self._count_lock:
+            setattr(self, outcome, getattr(self, outcome) + 1)
+
+    def _post(self, issue: Issue, comment: str) -> bool:
+        with self._count_lock:
+            duplicate = repr(issue) in self._submitted
+            self._submitted.add(repr(issue))
+
+        if duplicate or (self.journal and self.journal.has_posted(issue)):
+            logger.info("Issue %s has already been commented on, skipping.", issue)
+            self._count("skipped")
+            return False
+
+        if self.journal:
+            self.journal.record(issue=issue, comment=comment, state="pending")
+
+        posted, outcome = False, "failed"
+        for attempt in range(self.max_retries + 1):
+            self._pace()
+            try:
+                posted = comment_on_github_issue(
+                    issue=issue,
+                    comment=comment,
+                    token=self.token,
+                    raise_errors=True,
+                )
+                outcome = "posted" if posted else "failed"
+                break
+            except GitHubCommentsRateLimitError as error:
+                if attempt == self.max_retries:
+                    logger.error(error)
+                    break
+                logger.warning(
+                    "Hit a GitHub rate-limit commenting on issue %s, retrying in %s seconds.",
+                    issue,
+                    error.retry_after,
+                )
+                time.sleep(error.retry_after)
+            except GitHubCommentsAPIError as error:
+                logger.error(error)
+                break
+            except requests.ConnectTimeout as error:
+                logger.error(
+                    "Couldn't connect to GitHub to comment on %s: %s", issue, error
+                )
+                break
+            except requests.RequestException as error:
+                # the request may have reached GitHub, so don't risk posting it again
+                logger.error(
+                    "Request to comment on issue %s failed, the comment may have been "
+                    "posted so it won't be retried: %s",
+                    issue,
+                    error,
+                )
+                outcome = "uncertain"
+                break
+
+        if self.journal:
+            self.journal.record(issue=issue, comment=comment, state=outcome)
+
+        self._count(outcome)
+        logger.info("Comment %s on issue %s.", outcome, issue)
+        return posted
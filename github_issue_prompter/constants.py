@@ -2,3 +2,18 @@
 PROMPTER_GITHUB_TOKEN = "PROMPTER_GITHUB_TOKEN"
 PROMPTER_OPENAI_TOKEN = "PROMPTER_OPENAI_TOKEN"
 PROMPTER_LOG_LEVEL = "PROMPTER_LOG_LEVEL"
+PROMPTER_COMMENT_JOURNAL = "PROMPTER_COMMENT_JOURNAL"
+PROMPTER_COMMENT_WINDOW = "PROMPTER_COMMENT_WINDOW"
+
+
+# default file used to record posted comments, so issues are never commented on twice
+DEFAULT_COMMENT_JOURNAL = ".prompter/comments.jsonl"
+
+# default number of days after a comment that an issue isn't commented on again
+DEFAULT_COMMENT_WINDOW = 30
+
+# default file used to record a run's progress, so it can be resumed
+DEFAULT_CHECKPOINT = ".prompter/checkpoint.jsonl"
+
+# default file the local mode's trained model is saved to and loaded from
+DEFAULT_LOCAL_MODEL = ".prompter/model.json"
@@ -0,0 +1,178 @@
+import logging
+import random
+import re
+from hashlib import blake2b
+
+from github_issue_prompter.status import prompt_comment
+from github_issue_prompter.types import Issue, IssueStatus, Status
+
+
+logger = logging.getLogger(__name__)
+
+
+_PRIME = (1 << 61) - 1
+_WORD = re.compile(r"\w+")
+
+
+class DuplicateIndex:
+    """
+    Class to find near-duplicate issue's (by title and body text), so each is only checked once.
+
+    Issue's are indexed as their status is found, using MinHash signatures split into
+    locality-sensitive hashing bands, so finding candidates is cheap however many issue's
+    have been indexed. Candidates are then confirmed by their exact shingle similarity.
+
+    A duplicate is given the same status as the issue it duplicates, as long as it's in the
+    same state (assigned or not, commented on or not), with any comment addressed to it's own
+    author or assignees. Otherwise (or if the status was an error) the duplicate is re-checked.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.8,
+        num_perm: int = 64,
+        bands: int = 16,
+        seed: int = 0,
+    ):
+        """
+        Parameters
+        ----------
+        threshold : float = 0.8
+            How similar (jaccard similarity of word shingles) issue's must be to be duplicates.
+        num_perm : int = 64
+            The number of hash functions used in each MinHash signature.
+        bands : int = 16
+            The number of bands each signature is split into for hashing, must divide num_perm.
+        seed : int = 0
+        """
+        if num_perm % bands:
+            raise ValueError(f"bands ({bands}) must divide num_perm ({num_perm}).")
+
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = num_perm // bands
+
+        _random = random.Random(seed)
+        self._hashes = [
+            (_random.randrange(1, _PRIME), _random.randrange(0, _PRIME))
+            for _ in range(num_perm)
+        ]
+        self._buckets: dict[tuple[int, tuple[int, ...]], list[str]] = {}
+        self._indexed: dict[str, tuple[Issue, IssueStatus, frozenset[int]]] = {}
+        self._cache: dict[str, tuple[frozenset[int], list[int]]] = {}
+
+    @staticmethod
+    def _shingles(issue: Issue, size: int = 3) -> frozenset[int]:
+        words = _WORD.findall(f"{issue.title} {issue.body}".lower())
+        shingles = [
+            " ".join(words[_i : _i + size])
+            for _i in range(max(len(words) - size + 1, 1))
+        ]
+        return frozenset(
+            int.from_bytes(blake2b(_s.encode(), digest_size=8).digest(), "little")
+            for _s in shingles
+        )
+
+    def _signature(self, issue: Issue) -> tuple[frozenset[int], list[int]]:
+        key = repr(issue)
+        if key not in self._cache:
+            shingles = self._shingles(issue)
+            signature = [
+                min((_a * _s + _b) % _PRIME for _s in shingles) if shingles else 0
+                for _a, _b in self._hashes
+            ]
+            self._cache[key] = (shingles, signature)
+        return self._cache[key]
+
+    def _bands(self, signature: list[int]) -> list[tuple[int, tuple[int, ...]]]:
+        return [
+            (_b, tuple(signature[_b * self.rows : (_b + 1) * self.rows]))
+            for _b in range(self.bands)
+        ]
+
+    def find(self, issue: Issue) -> tuple[Issue, IssueStatus] | None:
+        """
+        Find the most similar indexed issue, if any are similar enough to be a duplicate.
+
+        Parameters
+        ----------
+        issue : Issue
+
+        Returns
+        -------
+        tuple[Issue, IssueStatus] | None
+            The duplicated issue and it's status, or None if there isn't one.
+        """
+        shingles, signature = self._signature(issue)
+
+        candidates = {
+            _key
+            for _band in self._bands(signature)
+            for _key in self._buckets.get(_band, [])
+        }
+
+        best, best_similarity = None, self.threshold
+        for _key in sorted(candidates):
+            other, status, other_shingles = self._indexed[_key]
+            similarity = len(shingles & other_shingles) / len(shingles | other_shingles)
+            if similarity >= best_similarity:
+                best, best_similarity = (other, status), similarity
+
+        return best
+
+    def add(self, issue: Issue, status: IssueStatus) -> None:
+        """
+        Index an (original) issue with it's status, so duplicates of it can be found.
+
+        Parameters
+        ----------
+        issue : Issue
+        status : IssueStatus
+        """
+        key = repr(issue)
+        shingles, signature = self._signature(issue)
+        self._cache.pop(key)
+
+        if key in self._indexed:
+            return
+
+        self._indexed[key] = (issue, status, shingles)
+        for _band in self._bands(signature):
+            self._buckets.setdefault(_band, []).append(key)
+
+    def duplicate_status(self, issue: Issue) -> IssueStatus | None:
+        """
+        Get the status of the issue, if it can be taken from an issue it duplicates.
+
+        Parameters
+        ----------
+        issue : Issue
+
+        Returns
+        -------
+        IssueStatus | None
+            The status, or None if the issue needs to be checked itself.
+        """
+        duplicate = self.find(issue)
+        if duplicate is None:
+            return None
+
+        other, status = duplicate
+        if (
+            status.status != Status.ERROR
+            and bool(issue.assignees) == bool(other.assignees)
+            and bool(issue.comments) == bool(other.comments)
+        ):
+            logger.debug(
+                "Issue %s is a duplicate of %s issue %s.", issue, status.status, other
+            )
+            self._cache.pop(repr(issue))  # won't be indexed, only originals are
+            return IssueStatus(
+                status=status.status,
+                reason=f"The issue is a near-duplicate of {other!r}, which is "
+                f"{status.status}" + (f": {status.reason}" if status.reason else "."),
+                comment=prompt_comment(issue=issue, status=status.status),
+            )
+
+        logger.debug("Issue %s is a duplicate of %s, re-checking it.", issue, other)
+        return None
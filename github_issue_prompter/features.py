@@ -0,0 +1,96 @@
+import math
+from datetime import datetime
+
+from github_issue_prompter.types import Issue
+
+
+# phrases suggesting someone has claimed the issue, or is working on it
+CLAIM_KEYWORDS = [
+    "working on",
+    "work on this",
+    "i'll take",
+    "i will take",
+    "take this",
+    "assign me",
+    "assigned to me",
+    "pull request",
+    "opened a pr",
+    "draft pr",
+    "in progress",
+]
+
+# phrases suggesting the issue has stalled, or is up for grabs
+STALL_KEYWORDS = [
+    "any update",
+    "still working",
+    "still open",
+    "is anyone",
+    "can i take",
+    "can i work",
+    "up for grabs",
+    "help wanted",
+    "good first issue",
+    "stale",
+]
+
+FEATURE_NAMES = [
+    "assignee_count",
+    "is_assigned",
+    "comment_count",
+    "has_comments",
+    "log_days_since_comment",
+    "log_days_since_update",
+    "log_days_since_created",
+    "assignee_commented",
+    "last_comment_by_assignee",
+    "last_comment_by_author",
+    "claim_keywords",
+    "stall_keywords",
+]
+
+
+def _log_days(since: datetime, now: datetime) -> float:
+    return math.log1p(max((now - since).total_seconds() / 86400, 0))
+
+
+def _count_keywords(text: str, keywords: list[str]) -> int:
+    return sum(1 for _k in keywords if _k in text)
+
+
+def issue_features(issue: Issue, now: datetime | None = None) -> list[float]:
+    """
+    Extract cheap numerical features describing an issue's activity, for ranking/classifying.
+
+    Parameters
+    ----------
+    issue : Issue
+    now : datetime | None = None
+        The time to measure how long ago activity was, if None will use the current time.
+
+    Returns
+    -------
+    list[float]
+        The feature values, in the order given by FEATURE_NAMES.
+    """
+    now = now or datetime.now()
+
+    # comments are ordered most recently updated first
+    last_comment = issue.comments[0] if issue.comments else None
+    last_activity = last_comment.updated if last_comment else issue.updated
+    comment_authors = {_c.author for _c in issue.comments}
+    comment_text = " ".join(_c.body for _c in issue.comments).lower()
+
+    return [
+        float(len(issue.assignees)),
+        float(bool(issue.assignees)),
+        float(len(issue.comments)),
+        float(bool(issue.comments)),
+        _log_days(last_activity, now),
+        _log_days(issue.updated, now),
+        _log_days(issue.created, now),
+        float(bool(comment_authors & set(issue.assignees))),
+        float(bool(last_comment and last_comment.author in issue.assignees)),
+        float(bool(last_comment and last_comment.author == issue.author)),
+        float(_count_keywords(comment_text, CLAIM_KEYWORDS)),
+        float(_count_keywords(comment_text, STALL_KEYWORDS)),
+    ]
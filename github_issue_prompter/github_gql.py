@@ -1,9 +1,8 @@
 import logging
 from datetime import datetime
-from typing import Any
-
-import requests
+from typing import Any, Callable
 
+from github_issue_prompter.github_http import github_request
 from github_issue_prompter.types import Issue, IssueComment
 
 
@@ -49,13 +48,13 @@ def query_graphql(
         The queried data.
     """
     logger.debug("Querying GitHub GraphQL: %s", query)
-    response = requests.post(
+    response = github_request(
+        method="POST",
         url="https://api.github.com/graphql",
+        token=token,
+        resource="graphql",
         json={"query": query},
-        headers={
-            "Authorization": f"Bearer {token}",
-            "Accept": "application/vnd.github+json",
-        },
+        headers={"Accept": "application/vnd.github+json"},
         timeout=timeout,
     )
 
@@ -79,6 +78,8 @@ def query_graphql(
 def get_repository_list(
     organisation: str,
     token: str,
+    cursor: str | None = None,
+    on_page: Callable[[list[str], str | None, bool], None] | None = None,
 ) -> list[str]:
     """
     Query a list of repositories for a given GitHub user/organisation (the owner).
@@ -87,6 +88,11 @@ def get_repository_list(
     ----------
     organisation : str
     token : str
+    cursor : str | None = None
+        The page cursor to start querying from, to resume a previous query.
+    on_page : Callable[[list[str], str | None, bool], None] | None = None
+        Called after each page is queried, with the page's repositories,
+        the cursor for the next page, and whether there is a next page.
 
     Returns
     -------
@@ -98,7 +104,6 @@ def get_repository_list(
         organisation,
     )
     has_next_page = True
-    cursor: str | None = None
     data: set[str] = set()
 
     while has_next_page:
@@ -131,10 +136,14 @@ def get_repository_list(
         next_result = query_graphql(query=query, token=token)
 
         # extract data from the result
-        data.update([r["name"] for r in next_result["org"]["repositories"]["nodes"]])
+        page = [r["name"] for r in next_result["org"]["repositories"]["nodes"]]
+        data.update(page)
         has_next_page = next_result["org"]["repositories"]["pageInfo"]["hasNextPage"]
         cursor = next_result["org"]["repositories"]["pageInfo"]["endCursor"]
 
+        if on_page:
+            on_page(page, cursor, has_next_page)
+
     return list(data)
 
 
@@ -142,6 +151,8 @@ def get_issue_list(
     organisation: str,
     repository: str,
     token: str,
+    cursor: str | None = None,
+    on_page: Callable[[list[Issue], str | None, bool], None] | None = None,
 ) -> list[Issue]:
     """
     Query a list of issues for a given GitHub repository.
@@ -151,6 +162,11 @@ def get_issue_list(
     organisation : str
     repository : str
     token : str
+    cursor : str | None = None
+        The page cursor to start querying from, to resume a previous query.
+    on_page : Callable[[list[Issue], str | None, bool], None] | None = None
+        Called after each page is queried, with the page's issues,
+        the cursor for the next page, and whether there is a next page.
 
     Returns
     -------
@@ -164,7 +180,6 @@ def get_issue_list(
     )
 
     has_next_page = True
-    cursor: str | None = None
     data: list[Issue] = []
 
     while has_next_page:
@@ -224,8 +239,9 @@ def get_issue_list(
         next_result = query_graphql(query=query, token=token)
 
         # extract data from the result
+        page: list[Issue] = []
         for issue in next_result["repository"]["issues"]["nodes"]:
-            data.append(
+            page.append(
                 Issue(
                     organisation=organisation,
                     repository=repository,
@@ -247,7 +263,11 @@ def get_issue_list(
                 )
             )
 
+        data.extend(page)
         has_next_page = next_result["repository"]["issues"]["pageInfo"]["hasNextPage"]
         cursor = next_result["repository"]["issues"]["pageInfo"]["endCursor"]
 
+        if on_page:
+            on_page(page, cursor, has_next_page)
+
     return data
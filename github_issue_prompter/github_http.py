@@ -0,0 +1,124 @@
+import logging
+import threading
+import time
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimitBudget:
+    """
+    Class to track the GitHub API rate-limit, shared by every request made in the process.
+
+    GitHub reports the remaining budget of each resource (core, graphql, ...) in the
+    response headers, so the latest values are stored and used to pause before a
+    request would exhaust the budget.
+    """
+
+    def __init__(self, reserve: int = 10):
+        self.reserve = reserve
+        self._limits: dict[str, tuple[int, float]] = {}
+        self._lock = threading.Lock()
+
+    def update(self, resource: str, response: requests.Response) -> None:
+        """Record the rate-limit headers returned with a response."""
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        reset = response.headers.get("X-RateLimit-Reset")
+        if remaining is None or reset is None:
+            return
+
+        resource = response.headers.get("X-RateLimit-Resource", resource)
+        with self._lock:
+            self._limits[resource] = (int(remaining), float(reset))
+
+    def remaining(self, resource: str) -> int | None:
+        """The last known remaining budget for a resource, None if unknown."""
+        with self._lock:
+            limit = self._limits.get(resource)
+        return limit[0] if limit else None
+
+    def wait(self, resource: str) -> None:
+        """Block until the resource has budget to spare, if it is close to running out."""
+        with self._lock:
+            limit = self._limits.get(resource)
+
+        if limit is None:
+            return
+
+        remaining, reset = limit
+        delay = reset - time.time()
+        if remaining <= self.reserve and delay > 0:
+            logger.warning(
+                "GitHub %s rate-limit nearly exhausted (%s remaining), "
+                "waiting %.0f seconds for it to reset.",
+                resource,
+                remaining,
+                delay,
+            )
+            time.sleep(delay)
+
+
+# shared across the whole process, so separate runs don't each keep their own view
+rate_limit = RateLimitBudget()
+
+_session: requests.Session | None = None
+_session_lock = threading.Lock()
+
+
+def get_session(pool_size: int = 10) -> requests.Session:
+    """
+    Get the shared requests session, so connections to GitHub are pooled and reused.
+
+    Parameters
+    ----------
+    pool_size : int = 10
+        The maximum number of connections to keep open, only used on first call.
+
+    Returns
+    -------
+    requests.Session
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+            _session.mount("https://", adapter)
+        return _session
+
+
+def github_request(
+    method: str,
+    url: str,
+    token: str,
+    resource: str,
+    **kwargs: Any,
+) -> requests.Response:
+    """
+    Make a request to the GitHub API, using the shared session and rate-limit budget.
+
+    Parameters
+    ----------
+    method : str
+    url : str
+    token : str
+    resource : str
+        The rate-limit resource the request counts towards (e.g. "core" or "graphql").
+    **kwargs
+        Passed through to `requests.Session.request`.
+
+    Returns
+    -------
+    requests.Response
+    """
+    headers = {"Authorization": f"Bearer {token}", **kwargs.pop("headers", {})}
+
+    rate_limit.wait(resource=resource)
+    response = get_session().request(method=method, url=url, headers=headers, **kwargs)
+    rate_limit.update(resource=resource, response=response)
+
+    return response
@@ -1,8 +1,8 @@
 import json
 import logging
+import time
 
-import requests
-
+from github_issue_prompter.github_http import github_request
 from github_issue_prompter.types import Issue
 
 
@@ -13,6 +13,12 @@ class GitHubCommentsAPIError(Exception):
     pass
 
 
+class GitHubCommentsRateLimitError(GitHubCommentsAPIError):
+    def __init__(self, message: str, retry_after: float):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
 def comment_on_github_issue(
     issue: Issue,
     comment: str,
@@ -38,13 +44,36 @@ def comment_on_github_issue(
     """
     logger.debug("Posting comment on GitHub Issue %s: %s", issue, comment)
 
-    response = requests.post(
+    response = github_request(
+        method="POST",
         url=f"https://api.github.com/repos/{issue}/comments",
-        headers={"Authorization": f"Bearer {token}"},
+        token=token,
+        resource="core",
         data=json.dumps({"body": comment}),
         timeout=timeout,
     )
 
+    if response.status_code in [403, 429] and (
+        "Retry-After" in response.headers
+        or response.headers.get("X-RateLimit-Remaining") == "0"
+    ):
+        # primary or secondary rate-limit hit, the request can be retried later
+        if "Retry-After" in response.headers:
+            retry_after = float(response.headers["Retry-After"])
+        else:
+            reset = float(response.headers.get("X-RateLimit-Reset", time.time() + 60))
+            retry_after = max(reset - time.time(), 1.0)
+        error_message = (
+            f"Hit a GitHub rate-limit commenting via the Rest API, "
+            f"returning code: {response.status_code}, retry after: {retry_after}s. "
+            f"Issue: {issue}, comment: {comment}"
+        )
+        if raise_errors:
+            raise GitHubCommentsRateLimitError(error_message, retry_after=retry_after)
+        else:
+            logger.error(error_message)
+            return False
+
     if response.status_code not in [200, 201]:
         error_message = (
             f"Failed to comment on GitHub issue via the Rest API, "
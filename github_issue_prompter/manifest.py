@@ -0,0 +1,348 @@
+import heapq
+import json
+import logging
+import sys
+from dataclasses import dataclass, field, fields
+from pathlib import Path
+from typing import Any
+
+from github_issue_prompter.budget import (
+    BudgetExhaustedError,
+    BudgetGovernor,
+    BudgetLimits,
+)
+from github_issue_prompter.dedupe import DuplicateIndex
+from github_issue_prompter.prompter import (
+    check_issue,
+    get_checkpoint,
+    get_comment_poster,
+    get_github_token,
+    get_status_client,
+    handle_issue_status,
+    log_response_stats,
+    query_issues,
+)
+from github_issue_prompter.ranking import likelihood_score
+from github_issue_prompter.sinks import ResultSink
+from github_issue_prompter.types import (
+    BudgetExhaustedAction,
+    Issue,
+    IssueCheckMode,
+    PostCommentsOptions,
+    ResponseStats,
+    ResultSource,
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ManifestTarget:
+    """Class to store the options for a single organisation (or repositories) to prompt."""
+
+    organisation: str
+    repositories: list[str] | None = None
+    mode: IssueCheckMode = IssueCheckMode.AI
+    prompt_count: int = 5
+    post_comments: PostCommentsOptions = PostCommentsOptions.NONE
+    only_assigned: bool = False
+    priority: int = 0
+    dedupe: bool = False
+    rank: bool = False
+    options: dict[str, Any] = field(default_factory=dict)
+
+    def __post_init__(self):
+        self.mode = IssueCheckMode(self.mode)
+        self.post_comments = PostCommentsOptions(self.post_comments)
+        if self.prompt_count <= 0:
+            raise ValueError(
+                f"Number of prompts must be a positive integer, given: {self.prompt_count} "
+                f"(target: {self})"
+            )
+
+    def __str__(self) -> str:
+        repos = ",".join(self.repositories) if self.repositories else "*"
+        return f"{self.organisation}/{repos}"
+
+
+@dataclass
+class Manifest:
+    """Class to store a list of targets to prompt in a single run."""
+
+    targets: list[ManifestTarget]
+    max_prompts: int | None = None
+    budget: BudgetGovernor | None = None
+
+
+def _read_manifest_file(path: Path) -> dict[str, Any]:
+    """
+    Read the raw manifest data from a TOML, YAML or JSON file.
+
+    Parameters
+    ----------
+    path : Path
+
+    Returns
+    -------
+    dict[str, Any]
+    """
+    match path.suffix.lower():
+        case ".toml":
+            if sys.version_info >= (3, 11):
+                import tomllib
+            else:
+                import tomli as tomllib
+
+            with path.open("rb") as file:
+                return tomllib.load(file)
+
+        case ".yaml" | ".yml":
+            try:
+                import yaml
+            except ImportError as error:
+                raise ImportError(
+                    "PyYAML must be installed to read YAML manifests, "
+                    "install with: pip install github-issue-prompter[yaml]"
+                ) from error
+
+            with path.open() as file:
+                return yaml.safe_load(file)
+
+        case ".json":
+            with path.open() as file:
+                return json.load(file)
+
+        case _:
+            raise ValueError(
+                f"Unsupported manifest file type, must be TOML, YAML or JSON: {path}"
+            )
+
+
+def load_manifest(path: str | Path) -> Manifest:
+    """
+    Load a manifest of targets to prompt from a file.
+
+    Each target takes the same options as `prompt_issues`, plus a list of `repositories`
+    and a `priority`. Targets inherit any options set in the top-level `defaults`, and
+    any options for the issue check mode (e.g. `model`) are set in an `options` table.
+
+    An optional top-level `budget` sets the run's ai mode limits (`max_tokens`,
+    `max_requests`, `max_seconds`) and `on_exhausted` action, with per-organisation
+    limits set in `budget.organisation`.
+
+    Parameters
+    ----------
+    path : str | Path
+
+    Returns
+    -------
+    Manifest
+    """
+    data = _read_manifest_file(Path(path))
+
+    defaults = data.get("defaults", {})
+    target_fields = {f.name for f in fields(ManifestTarget)}
+
+    targets = []
+    for raw_target in data.get("targets", []):
+        raw_target = {**defaults, **raw_target}
+        if "repository" in raw_target:
+            raw_target["repositories"] = [raw_target.pop("repository")]
+
+        unknown = sorted(set(raw_target) - target_fields)
+        if unknown:
+            raise ValueError(
+                f"Unknown target options {unknown} in manifest: {path} "
+                f"(issue check mode options must be set in the target's `options` table)"
+            )
+
+        raw_target["options"] = dict(raw_target.get("options", {}))
+        targets.append(ManifestTarget(**raw_target))
+
+    if not targets:
+        raise ValueError(f"No targets found in manifest: {path}")
+
+    budget = None
+    if "budget" in data:
+        raw_budget = dict(data["budget"])
+        budget = BudgetGovernor(
+            organisation_limits=BudgetLimits(**raw_budget.pop("organisation", {})),
+            on_exhausted=raw_budget.pop("on_exhausted", BudgetExhaustedAction.STOP),
+            run_limits=BudgetLimits(**raw_budget),
+        )
+
+    return Manifest(
+        targets=targets,
+        max_prompts=data.get("max_prompts"),
+        budget=budget,
+    )
+
+
+def prompt_manifest(
+    manifest: Manifest | str | Path,
+    github_token: str | None = None,
+    openai_token: str | None = None,
+    max_prompts: int | None = None,
+    comment_journal: str | None = None,
+    checkpoint: str | None = None,
+    resume: bool = False,
+    sinks: list[ResultSink] | None = None,
+    budget: BudgetGovernor | None = None,
+) -> None:
+    """
+    Query and check the issue's of every target in a manifest, in a single run.
+
+    All targets share the same GitHub connections and rate-limit budget. Issue's from every
+    target are checked from a single queue, highest priority targets first, until each
+    target has found its `prompt_count` issues or the global `max_prompts` is reached.
+
+    Parameters
+    ----------
+    manifest : Manifest | str | Path
+        The manifest, or a path to a manifest file.
+    github_token : str | None = None
+    openai_token : str | None = None
+    max_prompts : int | None = None
+        The maximum number of issue's to prompt across all targets, overrides the manifest.
+    comment_journal : str | None = None
+        File recording posted comments, so re-runs never comment on an issue twice.
+    checkpoint : str | None = None
+        File to record the run's progress to, so it can be resumed if it stops.
+    resume : bool = False
+        Whether to resume the run recorded in the checkpoint file.
+    sinks : list[ResultSink] | None = None
+        Where to stream each issue's result to, as soon as it's checked.
+    budget : BudgetGovernor | None = None
+        Limits the tokens, requests and time spent by the ai mode, overrides the manifest.
+        If neither is given, an unlimited budget is used with the ai mode, so the spend
+        is reported.
+    """
+    if not isinstance(manifest, Manifest):
+        manifest = load_manifest(manifest)
+
+    max_prompts = max_prompts if max_prompts is not None else manifest.max_prompts
+    budget = budget or manifest.budget
+    if budget is None and any(_t.mode == IssueCheckMode.AI for _t in manifest.targets):
+        budget = BudgetGovernor()  # unlimited, to report the spend
+    if max_prompts is not None and max_prompts <= 0:
+        raise ValueError(
+            f"Maximum number of prompts must be a positive integer, given: {max_prompts}"
+        )
+
+    logger.info(
+        "Prompting issues for %s targets (max_prompts: %s).",
+        len(manifest.targets),
+        max_prompts,
+    )
+
+    _github_token = get_github_token(github_token=github_token)
+    _status_client = get_status_client(
+        modes=[t.mode for t in manifest.targets],
+        openai_token=openai_token,
+    )
+    _poster = get_comment_poster(
+        post_comments=[t.post_comments for t in manifest.targets],
+        token=_github_token,
+        comment_journal=comment_journal,
+    )
+
+    _checkpoint = get_checkpoint(
+        checkpoint=checkpoint,
+        resume=resume,
+        run={"targets": [f"{t} ({t.mode})" for t in manifest.targets]},
+    )
+
+    # queue the issue's from every target, highest priority first, then most likely to be
+    # stale or free first (for targets that rank issues), then by creation date
+    queue: list[tuple[int, float, float, int, int, Issue]] = []
+    for index, target in enumerate(manifest.targets):
+        issues = query_issues(
+            organisation=target.organisation,
+            repositories=target.repositories,
+            token=_github_token,
+            only_assigned=target.only_assigned,
+            checkpoint=_checkpoint,
+        )
+        logger.info("Queried %s potential issues from %s.", len(issues), target)
+
+        for issue in issues:
+            heapq.heappush(
+                queue,
+                (
+                    -target.priority,
+                    -likelihood_score(issue=issue) if target.rank else 0.0,
+                    issue.created.timestamp(),
+                    len(queue),
+                    index,
+                    issue,
+                ),
+            )
+
+    logger.info("Queried %s potential issues to check for staleness.", len(queue))
+
+    duplicates = [DuplicateIndex() if t.dedupe else None for t in manifest.targets]
+    response_stats = ResponseStats()
+
+    issues_processed = [0] * len(manifest.targets)
+    exhausted: set[str] = set()  # organisations with no ai budget left
+    try:
+        while queue and (max_prompts is None or sum(issues_processed) < max_prompts):
+            *_, index, issue = heapq.heappop(queue)
+            target = manifest.targets[index]
+
+            if issues_processed[index] >= target.prompt_count:
+                continue  # this target already has enough, skip the rest of it's issues
+
+            if target.organisation in exhausted:
+                continue  # this target's organisation has spent it's budget
+
+            try:
+                _result = check_issue(
+                    issue=issue,
+                    mode=target.mode,
+                    client=_status_client,
+                    checkpoint=_checkpoint,
+                    duplicates=duplicates[index],
+                    budget=budget,
+                    response_stats=response_stats,
+                    **target.options,
+                )
+            except BudgetExhaustedError as error:
+                if error.organisation is None:
+                    break  # the whole run has spent it's budget
+                exhausted.add(error.organisation)
+                continue
+
+            if handle_issue_status(
+                issue=issue,
+                status=_result.status,
+                post_comments=target.post_comments,
+                poster=_poster,
+            ):
+                issues_processed[index] += 1
+
+            if _checkpoint and _result.source == ResultSource.CHECKED:
+                _checkpoint.record_result(
+                    issue=issue,
+                    status=_result.status,
+                )
+
+            for sink in sinks or []:
+                sink.write(result=_result)
+
+    finally:
+        if _poster:
+            _poster.close()  # wait for any queued comments to be posted
+
+    for target, processed in zip(manifest.targets, issues_processed):
+        logger.info("Found %s issues that can be worked on in %s.", processed, target)
+
+    logger.info(
+        "Success! %s issues that can be worked on have been found across %s targets.",
+        sum(issues_processed),
+        len(manifest.targets),
+    )
+    if budget:
+        logger.info(budget.summary())
+    log_response_stats(modes=[t.mode for t in manifest.targets], stats=response_stats)
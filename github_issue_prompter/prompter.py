@@ -1,13 +1,38 @@
 import logging
 import os
+from datetime import datetime, timedelta
+from functools import partial
+from time import perf_counter
+from typing import Any, Iterator
 
-from openai import OpenAI
-
-from github_issue_prompter.constants import PROMPTER_GITHUB_TOKEN, PROMPTER_OPENAI_TOKEN
+from github_issue_prompter.backends import get_backend, load
+from github_issue_prompter.budget import BudgetExhaustedError, BudgetGovernor
+from github_issue_prompter.checkpoint import Checkpoint
+from github_issue_prompter.commenter import CommentJournal, CommentPoster
+from github_issue_prompter.constants import (
+    DEFAULT_COMMENT_JOURNAL,
+    DEFAULT_COMMENT_WINDOW,
+    PROMPTER_COMMENT_JOURNAL,
+    PROMPTER_COMMENT_WINDOW,
+    PROMPTER_GITHUB_TOKEN,
+    PROMPTER_OPENAI_TOKEN,
+)
+from github_issue_prompter.dedupe import DuplicateIndex
 from github_issue_prompter.github_gql import get_issue_list, get_repository_list
-from github_issue_prompter.github_rest import comment_on_github_issue
+from github_issue_prompter.ranking import rank_issues
+from github_issue_prompter.sinks import ResultSink
 from github_issue_prompter.status import check_issue_status
-from github_issue_prompter.types import IssueCheckMode, PostCommentsOptions, Status
+from github_issue_prompter.types import (
+    BudgetExhaustedAction,
+    Issue,
+    IssueCheckMode,
+    IssueResult,
+    IssueStatus,
+    PostCommentsOptions,
+    ResponseStats,
+    ResultSource,
+    Status,
+)
 
 
 logger = logging.getLogger(__name__)
@@ -22,6 +47,13 @@ def prompt_issues(
     post_comments: PostCommentsOptions = PostCommentsOptions.NONE,
     only_assigned: bool = False,
     openai_token: str | None = None,
+    comment_journal: str | None = None,
+    checkpoint: str | None = None,
+    resume: bool = False,
+    sinks: list[ResultSink] | None = None,
+    dedupe: bool = False,
+    rank: bool = False,
+    budget: BudgetGovernor | None = None,
     **kwargs,
 ) -> None:
     """
@@ -37,8 +69,75 @@ def prompt_issues(
     post_comments : PostCommentsOptions = PostCommentsOptions.NONE
     only_assigned : bool = False
     openai_token : str | None = None
+    comment_journal : str | None = None
+        File recording posted comments, so re-runs never comment on an issue twice.
+        If None will default to PROMPTER_COMMENT_JOURNAL, or .prompter/comments.jsonl.
+    checkpoint : str | None = None
+        File to record the run's progress to, so it can be resumed if it stops.
+    resume : bool = False
+        Whether to resume the run recorded in the checkpoint file.
+    sinks : list[ResultSink] | None = None
+        Where to stream each issue's result to, as soon as it's checked.
+    dedupe : bool = False
+        Whether to find near-duplicate issue's, and only check each of them once.
+    rank : bool = False
+        Whether to check the issue's most likely to be stale or free first, rather than
+        by creation date, to find prompt_count issues with fewer checks.
+    budget : BudgetGovernor | None = None
+        Limits the tokens, requests and time spent by the ai mode, and reports the spend.
+        If None, an unlimited budget is used with the ai mode, so the spend is reported.
     **kwargs
     """
+    for _ in iter_prompt_issues(
+        organisation=organisation,
+        repository=repository,
+        github_token=github_token,
+        mode=mode,
+        prompt_count=prompt_count,
+        post_comments=post_comments,
+        only_assigned=only_assigned,
+        openai_token=openai_token,
+        comment_journal=comment_journal,
+        checkpoint=checkpoint,
+        resume=resume,
+        sinks=sinks,
+        dedupe=dedupe,
+        rank=rank,
+        budget=budget,
+        **kwargs,
+    ):
+        pass  # results are logged and written to the sinks as they're produced
+
+
+def iter_prompt_issues(
+    organisation: str,
+    repository: str | None = None,
+    github_token: str | None = None,
+    mode: IssueCheckMode | str = IssueCheckMode.AI,
+    prompt_count: int = 5,
+    post_comments: PostCommentsOptions = PostCommentsOptions.NONE,
+    only_assigned: bool = False,
+    openai_token: str | None = None,
+    comment_journal: str | None = None,
+    checkpoint: str | None = None,
+    resume: bool = False,
+    sinks: list[ResultSink] | None = None,
+    dedupe: bool = False,
+    rank: bool = False,
+    budget: BudgetGovernor | None = None,
+    **kwargs,
+) -> Iterator[IssueResult]:
+    """
+    Query and check issue's, yielding the result of each issue as soon as it's checked.
+
+    Takes the same parameters as `prompt_issues`. Results are yielded in the order the
+    issue's are checked, which is deterministic for the same issue's and options.
+
+    Yields
+    ------
+    IssueResult
+        The issue, it's checked status, and how long it took to check.
+    """
     logger.info(
         "Prompting issues for %s%s (mode: %s, prompt_count: %s, "
         "post_comments: %s, only_assigned: %s).",
@@ -51,120 +150,468 @@ def prompt_issues(
     )
 
     mode = IssueCheckMode(mode)
+    if budget is None and mode == IssueCheckMode.AI:
+        budget = BudgetGovernor()  # unlimited, to report the spend
+
+    _github_token = get_github_token(github_token=github_token)
+    _status_client = get_status_client(modes=[mode], openai_token=openai_token)
+
+    if prompt_count <= 0:
+        raise ValueError(
+            f"Number of prompts must be a positive integer, given: {prompt_count}"
+        )
+
+    _checkpoint = get_checkpoint(
+        checkpoint=checkpoint,
+        resume=resume,
+        run={
+            "organisation": organisation,
+            "repository": repository,
+            "mode": str(mode),
+            "only_assigned": only_assigned,
+        },
+    )
+
+    issues = query_issues(
+        organisation=organisation,
+        repositories=[repository] if repository else None,
+        token=_github_token,
+        only_assigned=only_assigned,
+        checkpoint=_checkpoint,
+    )
+
+    issues.sort(key=lambda i: i.created)  # prompt most recent issues first
+    if rank:
+        # prompt the issues most likely to be stale or free first
+        issues = rank_issues(issues=issues)
+
+    logger.info("Queried %s potential issues to check for staleness.", len(issues))
+
+    _poster = get_comment_poster(
+        post_comments=[post_comments],
+        token=_github_token,
+        comment_journal=comment_journal,
+    )
+
+    _duplicates = DuplicateIndex() if dedupe else None
+    _response_stats = ResponseStats()
+
+    # process each issue one-by-one, queueing/printing a comment if it's stale
+    issues_processed = 0
+    found: list[Issue] = []
+    try:
+        for issue in issues:
+            try:
+                _result = check_issue(
+                    issue=issue,
+                    mode=mode,
+                    client=_status_client,
+                    checkpoint=_checkpoint,
+                    duplicates=_duplicates,
+                    budget=budget,
+                    response_stats=_response_stats,
+                    **kwargs,
+                )
+            except BudgetExhaustedError:
+                break  # stop gracefully, keeping the results found so far
+
+            if handle_issue_status(
+                issue=issue,
+                status=_result.status,
+                post_comments=post_comments,
+                poster=_poster,
+            ):
+                issues_processed += 1
+                found.append(issue)
+
+            if _checkpoint and _result.source == ResultSource.CHECKED:
+                _checkpoint.record_result(
+                    issue=issue,
+                    status=_result.status,
+                )
+
+            for sink in sinks or []:
+                sink.write(result=_result)
+
+            yield _result
 
+            if issues_processed == prompt_count:
+                break
+
+    finally:
+        if _poster:
+            _poster.close()  # wait for any queued comments to be posted
+
+    logger.info(
+        "Success! %s issues that can be worked on have been found%s: %s",
+        issues_processed,
+        " and commented on" if post_comments else "",
+        # sorted, so found issues are listed in the same order whatever the check order
+        sorted(found, key=lambda i: (i.created, repr(i))),
+    )
+    if budget:
+        logger.info(budget.summary())
+    log_response_stats(modes=[mode], stats=_response_stats)
+
+
+def log_response_stats(modes: list[IssueCheckMode], stats: ResponseStats) -> None:
+    """
+    Log how the run's ai mode responses were parsed, if it was used.
+
+    Parameters
+    ----------
+    modes : list[IssueCheckMode]
+    stats : ResponseStats
+    """
+    if IssueCheckMode.AI in modes:
+        logger.info("ai mode %s.", stats)
+
+
+def check_issue(
+    issue: Issue,
+    mode: IssueCheckMode,
+    client: Any = None,
+    checkpoint: Checkpoint | None = None,
+    duplicates: DuplicateIndex | None = None,
+    budget: BudgetGovernor | None = None,
+    **kwargs,
+) -> IssueResult:
+    """
+    Check an issue's status, reusing the status recorded in the checkpoint if there is one,
+    or the status of an issue it duplicates if possible.
+
+    Parameters
+    ----------
+    issue : Issue
+    mode : IssueCheckMode
+    client : Any = None
+        The client used by the mode, if it needs one.
+    checkpoint : Checkpoint | None = None
+    duplicates : DuplicateIndex | None = None
+        Index of issue's already checked, to find duplicates in. The issue is added to it.
+    budget : BudgetGovernor | None = None
+        Checked before using the ai mode, which falls back to the simple mode if the
+        budget is exhausted and the governor allows it.
+    **kwargs
+        Method specific arguments for usage depending on the chosen mode.
+
+    Returns
+    -------
+    IssueResult
+
+    Raises
+    ------
+    BudgetExhaustedError
+        If the ai mode budget is exhausted, and the governor says to stop.
+    """
+    started = datetime.now()
+    timer = perf_counter()
+
+    _status = checkpoint.results.get(repr(issue)) if checkpoint else None
+    source = ResultSource.CHECKPOINT
+
+    if _status is None and duplicates is not None:
+        _status = duplicates.duplicate_status(issue=issue)
+        source = ResultSource.DUPLICATE
+
+    if _status is None:
+        source = ResultSource.CHECKED
+
+        if budget is not None and mode == IssueCheckMode.AI:
+            try:
+                budget.check(organisation=issue.organisation)
+            except BudgetExhaustedError:
+                if budget.on_exhausted == BudgetExhaustedAction.STOP:
+                    raise
+                mode = IssueCheckMode.SIMPLE
+
+        _status = check_issue_status(
+            mode=mode,
+            issue=issue,
+            client=client,
+            budget=budget,
+            **kwargs,
+        )
+
+    if duplicates is not None and source != ResultSource.DUPLICATE:
+        duplicates.add(issue=issue, status=_status)
+
+    return IssueResult(
+        issue=issue,
+        status=_status,
+        mode=mode,
+        source=source,
+        started=started,
+        duration=perf_counter() - timer,
+    )
+
+
+def get_github_token(github_token: str | None = None) -> str:
+    """
+    Get the GitHub API token to use, falling back to the environment variable.
+
+    Parameters
+    ----------
+    github_token : str | None = None
+
+    Returns
+    -------
+    str
+    """
     _github_token = github_token or os.getenv(PROMPTER_GITHUB_TOKEN)
     if _github_token is None:
         raise ValueError(
             "A GitHub API key must be passed in or assigned to "
             f"environment variable {PROMPTER_GITHUB_TOKEN}."
         )
+    return _github_token
+
+
+def get_status_client(
+    modes: list[IssueCheckMode],
+    openai_token: str | None = None,
+) -> Any:
+    """
+    Create the client needed to check issue statuses with the given modes.
+
+    Only modes whose backend needs a client (i.e. ai mode) cause it's dependencies
+    to be imported.
+
+    Parameters
+    ----------
+    modes : list[IssueCheckMode]
+        Every mode the client will be used with.
+    openai_token : str | None = None
+
+    Returns
+    -------
+    Any
+        The client (an OpenAI client) if any mode needs one, otherwise None.
+    """
+    backends = [get_backend(mode=_m) for _m in modes]
+    client_factories = {_b.client for _b in backends if _b.client is not None}
+    if not client_factories:
+        return None
 
     _openai_token = openai_token or os.getenv(PROMPTER_OPENAI_TOKEN)
-    if _openai_token is None and mode == IssueCheckMode.AI:
+    if _openai_token is None:
         raise ValueError(
             "An OpenAI API key must be passed in or assigned to environment variable "
             f"{PROMPTER_OPENAI_TOKEN} when {IssueCheckMode.AI} mode is selected."
         )
-    elif _openai_token:
-        _status_client = OpenAI(api_key=_openai_token)
-    else:
-        _status_client = None
 
-    if prompt_count <= 0:
-        raise ValueError(
-            f"Number of prompts must be a positive integer, given: {prompt_count}"
-        )
+    (client_factory,) = client_factories
+    return load(client_factory)(token=_openai_token)
+
+
+def get_comment_poster(
+    post_comments: list[PostCommentsOptions],
+    token: str,
+    comment_journal: str | None = None,
+) -> CommentPoster | None:
+    """
+    Create the background comment poster, if comments will be posted.
+
+    Parameters
+    ----------
+    post_comments : list[PostCommentsOptions]
+        Every post comments option the poster will be used with.
+    token : str
+    comment_journal : str | None = None
+
+    Returns
+    -------
+    CommentPoster | None
+        A comment poster, or None if no comments will be posted.
+    """
+    if all(_p == PostCommentsOptions.NONE for _p in post_comments):
+        return None
 
-    if not repository:
+    journal_path = (
+        comment_journal
+        or os.getenv(PROMPTER_COMMENT_JOURNAL)
+        or DEFAULT_COMMENT_JOURNAL
+    )
+    window = float(os.getenv(PROMPTER_COMMENT_WINDOW, DEFAULT_COMMENT_WINDOW))
+    journal = CommentJournal(
+        path=journal_path,
+        window=timedelta(days=window) if window > 0 else None,
+    )
+    return CommentPoster(token=token, journal=journal)
+
+
+def get_checkpoint(
+    checkpoint: str | None,
+    resume: bool,
+    run: dict[str, Any],
+) -> Checkpoint | None:
+    """
+    Create the checkpoint to record the run's progress to, if a checkpoint file is given.
+
+    Parameters
+    ----------
+    checkpoint : str | None
+    resume : bool
+    run : dict[str, Any]
+        The arguments identifying the run.
+
+    Returns
+    -------
+    Checkpoint | None
+    """
+    if checkpoint is None:
+        if resume:
+            raise ValueError(
+                "A checkpoint file must be given in order to resume a run."
+            )
+        return None
+
+    return Checkpoint(path=checkpoint, run=run, resume=resume)
+
+
+def query_issues(
+    organisation: str,
+    repositories: list[str] | None,
+    token: str,
+    only_assigned: bool = False,
+    checkpoint: Checkpoint | None = None,
+) -> list[Issue]:
+    """
+    Query the open issue's of the given repositories, or of all the organisations repositories.
+
+    Parameters
+    ----------
+    organisation : str
+    repositories : list[str] | None
+        The repositories to query, if None will query all repositories under the given owner.
+    token : str
+    only_assigned : bool = False
+    checkpoint : Checkpoint | None = None
+        Used to record query progress, and to resume from any previously recorded progress.
+
+    Returns
+    -------
+    list[Issue]
+    """
+    if not repositories:
         # query repositories in the given org
-        repos = get_repository_list(organisation=organisation, token=_github_token)
+        progress = checkpoint.repositories.get(organisation) if checkpoint else None
+        if progress and progress["done"]:
+            repositories = list(dict.fromkeys(progress["names"]))
+        else:
+            repositories = get_repository_list(
+                organisation=organisation,
+                token=token,
+                cursor=progress["cursor"] if progress else None,
+                on_page=(
+                    partial(checkpoint.record_repositories, organisation)
+                    if checkpoint
+                    else None
+                ),
+            )
+            if progress:
+                repositories = list(dict.fromkeys(progress["names"]))
+
         logger.info(
             "Queried %s repositories from %s: %s",
-            len(repos),
+            len(repositories),
             organisation,
-            repos,
+            repositories,
         )
-    else:
-        repos = [repository]
 
     # per repository, query the issue's (and relevant data)
     issues = []
-    for repo in repos:
-        issues.extend(
-            get_issue_list(
-                organisation=organisation,
-                repository=repo,
-                token=_github_token,
-            )
+    for repo in repositories:
+        progress = (
+            checkpoint.issues.get(f"{organisation}/{repo}") if checkpoint else None
         )
+        if progress and progress["done"]:
+            issues.extend(progress["issues"])
+            continue
+
+        repo_issues = get_issue_list(
+            organisation=organisation,
+            repository=repo,
+            token=token,
+            cursor=progress["cursor"] if progress else None,
+            on_page=(
+                partial(checkpoint.record_issues, f"{organisation}/{repo}")
+                if checkpoint
+                else None
+            ),
+        )
+        issues.extend(progress["issues"] if progress else repo_issues)
 
-    issues.sort(key=lambda i: i.created)  # prompt most recent issues first
     if only_assigned:
         # filter out unassigned issues if selected
         issues = [i for i in issues if i.assignees]
 
-    logger.info("Queried %s potential issues to check for staleness.", len(issues))
+    return issues
 
-    # process each issue one-by-one, making/printing a comment if it's stale
-    issues_processed = 0
-    for issue in issues:
-        _status = check_issue_status(
-            mode=mode,
-            issue=issue,
-            client=_status_client,
-            **kwargs,
-        )
 
-        # process issue depending on it's status
-        match _status.status:
-            case Status.STALE | Status.FREE:
-                posted = False
+def handle_issue_status(
+    issue: Issue,
+    status: IssueStatus,
+    post_comments: PostCommentsOptions,
+    poster: CommentPoster | None = None,
+) -> bool:
+    """
+    Process a checked issue depending on it's status, logging and queueing comments as required.
+
+    Parameters
+    ----------
+    issue : Issue
+    status : IssueStatus
+    post_comments : PostCommentsOptions
+    poster : CommentPoster | None = None
+        Used to post comments in the background, required unless post_comments is NONE.
 
-                if _status.comment is not None and (
+    Returns
+    -------
+    bool
+        True if the issue can be worked on (is stale or free), False otherwise.
+    """
+    match status.status:
+        case Status.STALE | Status.FREE:
+            queued = False
+
+            if (
+                poster is not None
+                and status.comment is not None
+                and (
                     post_comments == PostCommentsOptions.ALL
                     or (
                         post_comments == PostCommentsOptions.FREE
-                        and _status.status == Status.FREE
+                        and status.status == Status.FREE
                     )
                     or (
                         post_comments == PostCommentsOptions.STALE
-                        and _status.status == Status.STALE
-                    )
-                ):
-                    posted = comment_on_github_issue(
-                        issue=issue,
-                        comment=_status.comment,
-                        token=_github_token,
+                        and status.status == Status.STALE
                     )
-
-                issues_processed += 1
-                logger.info(
-                    "Issue %s found to be %s:\n\treason   - %s\n\tcomment  - %s\n\tposted   - %s\n",
-                    issue,
-                    _status.status,
-                    _status.reason,
-                    _status.comment,
-                    posted,
                 )
+            ):
+                poster.submit(issue=issue, comment=status.comment)
+                queued = True
 
-            case Status.ACTIVE:
-                logger.info("Issue %s is active.", issue)
+            logger.info(
+                "Issue %s found to be %s:\n\treason   - %s\n\tcomment  - %s\n\tqueued   - %s\n",
+                issue,
+                status.status,
+                status.reason,
+                status.comment,
+                queued,
+            )
+            return True
 
-            case Status.ERROR:
-                logger.info(
-                    "There was an error determining the status of issue %s.", issue
-                )
+        case Status.ACTIVE:
+            logger.info("Issue %s is active.", issue)
 
-            case _:
-                raise NotImplementedError(
-                    f"Unsupported issue Status found: {_status.status}"
-                )
+        case Status.ERROR:
+            logger.info("There was an error determining the status of issue %s.", issue)
 
-        if issues_processed == prompt_count:
-            break
+        case _:
+            raise NotImplementedError(
+                f"Unsupported issue Status found: {status.status}"
+            )
 
-    logger.info(
-        "Success! %s issues that can be worked on have been found%s.",
-        issues_processed,
-        " and commented on" if post_comments else "",
-    )
+    return False
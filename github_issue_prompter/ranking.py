@@ -0,0 +1,62 @@
+from datetime import datetime
+
+from github_issue_prompter.features import FEATURE_NAMES, issue_features
+from github_issue_prompter.types import Issue
+
+
+# how much each feature suggests an issue is stale or free (positive) or active (negative)
+RANKING_WEIGHTS = {
+    "assignee_count": -0.2,
+    "is_assigned": -0.5,
+    "comment_count": -0.1,
+    "has_comments": -1.0,
+    "log_days_since_comment": 0.6,
+    "log_days_since_update": 0.3,
+    "log_days_since_created": 0.0,
+    "assignee_commented": -0.3,
+    "last_comment_by_assignee": -0.5,
+    "last_comment_by_author": 0.3,
+    "claim_keywords": -0.7,
+    "stall_keywords": 0.5,
+}
+
+
+def likelihood_score(issue: Issue, now: datetime | None = None) -> float:
+    """
+    Score how likely an issue is to be stale or free, using only cheap local features.
+
+    Parameters
+    ----------
+    issue : Issue
+    now : datetime | None = None
+
+    Returns
+    -------
+    float
+        The higher the score, the more likely the issue can be worked on.
+    """
+    features = issue_features(issue=issue, now=now)
+    return sum(RANKING_WEIGHTS[_n] * _f for _n, _f in zip(FEATURE_NAMES, features))
+
+
+def rank_issues(issues: list[Issue], now: datetime | None = None) -> list[Issue]:
+    """
+    Order issue's by how likely they are to be stale or free, most likely first.
+
+    Ties are broken by creation date then issue number, so the order is deterministic.
+
+    Parameters
+    ----------
+    issues : list[Issue]
+    now : datetime | None = None
+
+    Returns
+    -------
+    list[Issue]
+    """
+    now = now or datetime.now()
+    scores = {repr(_i): likelihood_score(issue=_i, now=now) for _i in issues}
+    return sorted(
+        issues,
+        key=lambda _i: (-scores[repr(_i)], _i.created, repr(_i)),
+    )
@@ -0,0 +1,162 @@
+import json
+import sqlite3
+from pathlib import Path
+from typing import Any, Callable
+
+from github_issue_prompter.types import IssueResult
+
+
+class ResultSink:
+    """Base class for somewhere to stream issue results to, as soon as they're produced."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def write(self, result: IssueResult) -> None:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+
+class JSONLSink(ResultSink):
+    """Class to append each issue result to a file, as a json line."""
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = self.path.open("a")
+
+    def write(self, result: IssueResult) -> None:
+        self._file.write(json.dumps(result.to_dict()) + "\n")
+        self._file.flush()  # make each result usable as soon as it's produced
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class SQLiteSink(ResultSink):
+    """Class to insert each issue result into a SQLite database table."""
+
+    _COLUMNS = [
+        "issue",
+        "organisation",
+        "repository",
+        "number",
+        "status",
+        "reason",
+        "comment",
+        "mode",
+        "source",
+        "started",
+        "duration",
+        "data",
+    ]
+
+    def __init__(self, path: str | Path, table: str = "results"):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.table = table
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        self._connection.execute(
+            f"""
+            CREATE TABLE IF NOT EXISTS {table} (
+                issue TEXT,
+                organisation TEXT,
+                repository TEXT,
+                number INTEGER,
+                status TEXT,
+                reason TEXT,
+                comment TEXT,
+                mode TEXT,
+                source TEXT,
+                started TEXT,
+                duration REAL,
+                data TEXT
+            )
+            """
+        )
+        self._connection.commit()
+
+    def write(self, result: IssueResult) -> None:
+        row = result.to_dict()
+        row["data"] = json.dumps(row["data"])
+        self._connection.execute(
+            f"INSERT INTO {self.table} ({', '.join(self._COLUMNS)}) "
+            f"VALUES ({', '.join('?' for _ in self._COLUMNS)})",
+            [row[_c] for _c in self._COLUMNS],
+        )
+        self._connection.commit()  # make each result usable as soon as it's produced
+
+    def close(self) -> None:
+        self._connection.close()
+
+
+class CallbackSink(ResultSink):
+    """Class to pass each issue result to a callback function."""
+
+    def __init__(self, callback: Callable[[IssueResult], None]):
+        self.callback = callback
+
+    def write(self, result: IssueResult) -> None:
+        self.callback(result)
+
+
+def get_sink(path: str | Path) -> ResultSink:
+    """
+    Create a sink to write results to a file, with the type of sink chosen by file extension.
+
+    Parameters
+    ----------
+    path : str | Path
+        Either a json lines (.jsonl) or SQLite (.db, .sqlite) file.
+
+    Returns
+    -------
+    ResultSink
+    """
+    match Path(path).suffix.lower():
+        case ".jsonl":
+            return JSONLSink(path=path)
+        case ".db" | ".sqlite" | ".sqlite3":
+            return SQLiteSink(path=path)
+        case _:
+            raise ValueError(
+                f"Unsupported results file type, must be .jsonl, .db or .sqlite: {path}"
+            )
+
+
+def load_results(path: str | Path, table: str = "results") -> list[dict[str, Any]]:
+    """
+    Load the results previously written to a json lines or SQLite file by a sink.
+
+    Parameters
+    ----------
+    path : str | Path
+    table : str = "results"
+        The table results were written to, if a SQLite file.
+
+    Returns
+    -------
+    list[dict[str, Any]]
+        The results, as dictionaries created by `IssueResult.to_dict`.
+    """
+    match Path(path).suffix.lower():
+        case ".jsonl":
+            with Path(path).open() as file:
+                return [json.loads(line) for line in file if line.strip()]
+        case ".db" | ".sqlite" | ".sqlite3":
+            connection = sqlite3.connect(path)
+            connection.row_factory = sqlite3.Row
+            try:
+                rows = connection.execute(f"SELECT * FROM {table}").fetchall()
+            finally:
+                connection.close()
+            return [{**dict(_r), "data": json.loads(_r["data"])} for _r in rows]
+        case _:
+            raise ValueError(
+                f"Unsupported results file type, must be .jsonl, .db or .sqlite: {path}"
+            )
@@ -1,10 +1,7 @@
 import logging
-from dataclasses import asdict
 from datetime import datetime, timedelta
-from json import JSONDecodeError, loads
-
-from openai import OpenAI
 
+from github_issue_prompter.backends import get_backend, load
 from github_issue_prompter.types import Issue, IssueCheckMode, IssueStatus, Status
 
 
@@ -19,7 +16,8 @@ def check_issue_status(
     """
     Check whether an issue's status, and whether it needs prompting.
 
-    Use different StatusModes to configure the exact logic used for checking.
+    Use different StatusModes to configure the exact logic used for checking, each
+    mode's implementation is only imported when it's first used.
 
     Parameters
     ----------
@@ -34,15 +32,8 @@ def check_issue_status(
         An object detailing the current status of the issue, along with a reason
         and a comment that can be used to prompt the issue.
     """
-    match mode:
-        case IssueCheckMode.SIMPLE:
-            return _check_simple(issue=issue, **kwargs)
-        case IssueCheckMode.AI:
-            return _check_ai(issue=issue, **kwargs)
-        case _:
-            raise NotImplementedError(
-                f"Unsupported IssueCheckMode was provided: {mode}"
-            )
+    check = load(get_backend(mode=mode).check)
+    return check(issue=issue, **kwargs)
 
 
 def _check_simple(issue: Issue, **_) -> IssueStatus:
@@ -112,96 +103,35 @@ def _check_simple(issue: Issue, **_) -> IssueStatus:
     return IssueStatus(status=Status.ACTIVE)
 
 
-def _check_ai(
-    issue: Issue,
-    client: OpenAI,
-    model: str = "gpt-3.5-turbo",
-    max_tokens: int = 256,
-    temperature: float = 0.7,
-    additional_prompt_text: str | None = None,
-    **_,
-) -> IssueStatus:
+def prompt_comment(issue: Issue, status: Status) -> str | None:
     """
+    Build a comment to prompt an issue with the given status, addressed to it's assignees
+    if it has any, otherwise to it's author.
 
     Parameters
     ----------
-    issue: Issue
-        Object detailing all necessary issue information to check its status.
-    client: OpenAI
-        An initialised OpenAI API client.
-    model: str = "gpt-3.5-turbo"
-        What model to use when querying the API.
-    max_tokens: int = 256
-        The maximum amount of tokens to be used when querying the API.
-    temperature: float = 0.7
-        The temperature to be used when querying the API.
-    additional_prompt_text: str | None = None
-        Any additional text to be included in the prompt, to fine-tune the response.
-    **_
-        Unused kwargs.
+    issue : Issue
+    status : Status
 
     Returns
     -------
-    IssueStatus
-        An object detailing the current status of the issue, along with a reason
-        and a comment that can be used to prompt the issue.
+    str | None
+        The comment, or None if the issue doesn't need prompting.
     """
-    prompt = f"""
-The following is a python dictionary representation of a GitHub issue
-(with it's 5 most recent comments) that I'd like to work on,
-but I'm not sure if someone else is already working on it!
-
-The issue: {asdict(issue)}
-
-Can you tell me if the issue looks active, if work on it has gone stale,
-or if it's free to work on?
-
-Provide a reason, and also a comment I can post on the issue to prompt
-any users I may need to in order to begin work on it.
-
-Give your response as a python dictionary, in the following example format,
-where issue_status is one of \"active\", \"stale\" or \"free\":
-{{
-    \"status\": issue_status,
-    \"reason\": \"This is a reason for why the issue is in the current status.\",
-    \"comment\": 'This is a comment to post on the issue.\",
-}}
-
-{additional_prompt_text or ""}
-"""
-
-    response = client.chat.completions.create(
-        messages=[
-            {
-                "role": "user",
-                "content": prompt,
-            }
-        ],
-        model=model,
-        temperature=temperature,
-        max_tokens=max_tokens,
-        n=1,
-    )
-    response_json_str = response.choices[0].message.content
-
-    try:
-        response_dict = loads(response_json_str)  # parse the returned json string
-    except JSONDecodeError as error:
-        logger.error(
-            "Hit an error decoding the json string returned by the OpenAI API. "
-            "Response string: %s. Error: %s.",
-            response_json_str,
-            error,
-        )
-        return IssueStatus(status=Status.ERROR)
-
-    try:
-        return IssueStatus(**response_dict)  # return response object
-    except TypeError as error:
-        logger.error(
-            "Hit an error building IssueStatus from dictionary returned by the OpenAI API. "
-            "Response dictionary: %s. Error: %s.",
-            response_dict,
-            error,
-        )
-        return IssueStatus(status=Status.ERROR)
+    match status:
+        case Status.STALE if issue.assignees:
+            return (
+                f"Hey {issue.assignees_str}, I noticed this issue didn't seem to "
+                f"have any progress recently, and wondered if it was still "
+                f"actively being worked on or if I could take a look?"
+            )
+        case Status.STALE:
+            return (
+                f"Hey @{issue.author}, I noticed this issue didn't seem to have "
+                f"any progress, and wondered if it was available for me to "
+                f"look into?"
+            )
+        case Status.FREE:
+            return f"Hey @{issue.author}, mind if I take on this issue?"
+        case _:
+            return None
@@ -0,0 +1,263 @@
+import ast
+import logging
+import re
+from json import JSONDecodeError, dumps, loads
+from typing import Any
+
+from openai import OpenAI
+
+from github_issue_prompter.budget import BudgetExhaustedError, BudgetGovernor
+from github_issue_prompter.types import Issue, IssueStatus, ResponseStats, Status
+
+
+logger = logging.getLogger(__name__)
+
+
+_CODE_FENCE = re.compile(r"```(?:json|python)?\s*(.*?)```", re.DOTALL)
+_TRAILING_COMMA = re.compile(r",\s*([}\]])")
+
+_REPAIR_PROMPT = """
+The following response should be a JSON object with the keys "status" (one of
+"active", "stale" or "free"), "reason" and "comment", but it could not be parsed.
+Reply with only the corrected JSON object.
+
+{response}
+"""
+
+
+def create_client(token: str) -> OpenAI:
+    """
+    Create the OpenAI API client used to check issue's.
+
+    Parameters
+    ----------
+    token : str
+
+    Returns
+    -------
+    OpenAI
+    """
+    return OpenAI(api_key=token)
+
+
+def _parse_response(response: str | None) -> tuple[dict[str, Any] | None, bool]:
+    """
+    Parse the dictionary from a response, salvaging near-json where possible.
+
+    Code fences and any text around the outermost braces are stripped, then trailing
+    commas removed, before finally trying to read it as a python dictionary.
+
+    Parameters
+    ----------
+    response : str | None
+
+    Returns
+    -------
+    tuple[dict[str, Any] | None, bool]
+        The parsed dictionary (or None if it couldn't be parsed), and whether it
+        needed salvaging.
+    """
+    if not response:
+        return None, False
+
+    try:
+        parsed = loads(response)
+        return (parsed, False) if isinstance(parsed, dict) else (None, False)
+    except JSONDecodeError:
+        pass
+
+    text = response.strip()
+    if fenced := _CODE_FENCE.search(text):
+        text = fenced.group(1)
+    start, end = text.find("{"), text.rfind("}")
+    if start == -1 or end < start:
+        return None, False
+    text = _TRAILING_COMMA.sub(r"\1", text[start : end + 1])
+
+    try:
+        parsed = loads(text)
+    except JSONDecodeError:
+        try:
+            parsed = ast.literal_eval(text)  # e.g. single quotes, or True/None
+        except (ValueError, SyntaxError, MemoryError, RecursionError):
+            return None, False
+
+    return (parsed, True) if isinstance(parsed, dict) else (None, False)
+
+
+def _issue_status(response_dict: dict[str, Any] | None) -> IssueStatus | None:
+    """Build the IssueStatus from a parsed response, or None if it isn't valid."""
+    if response_dict is None:
+        return None
+
+    try:
+        status = Status.from_str(str(response_dict["status"]))
+    except (KeyError, ValueError):
+        return None
+    if status == Status.ERROR:
+        return None
+
+    return IssueStatus(
+        status=status,
+        reason=response_dict.get("reason"),
+        comment=response_dict.get("comment"),
+    )
+
+
+def _complete(
+    client: OpenAI,
+    organisation: str,
+    prompt: str,
+    budget: BudgetGovernor | None,
+    **kwargs,
+) -> str | None:
+    """Make a request to the OpenAI API, recording its usage, and return the response."""
+    response = client.chat.completions.create(
+        messages=[
+            {
+                "role": "user",
+                "content": prompt,
+            }
+        ],
+        n=1,
+        **kwargs,
+    )
+    if budget is not None:
+        budget.record(
+            organisation=organisation,
+            prompt_tokens=response.usage.prompt_tokens if response.usage else 0,
+            completion_tokens=response.usage.completion_tokens if response.usage else 0,
+        )
+
+    return response.choices[0].message.content
+
+
+def _check_ai(
+    issue: Issue,
+    client: OpenAI,
+    model: str = "gpt-3.5-turbo",
+    max_tokens: int = 256,
+    temperature: float = 0.7,
+    additional_prompt_text: str | None = None,
+    budget: BudgetGovernor | None = None,
+    json_mode: bool = True,
+    repair: bool = True,
+    response_stats: ResponseStats | None = None,
+    **_,
+) -> IssueStatus:
+    """
+    Determine whether an Issue is stale, active or free, by asking an OpenAI model.
+
+    Responses that aren't valid json are salvaged where possible, otherwise one repair
+    request is made, before the issue's status is given as an error.
+
+    Parameters
+    ----------
+    issue: Issue
+        Object detailing all necessary issue information to check its status.
+    client: OpenAI
+        An initialised OpenAI API client.
+    model: str = "gpt-3.5-turbo"
+        What model to use when querying the API.
+    max_tokens: int = 256
+        The maximum amount of tokens to be used when querying the API.
+    temperature: float = 0.7
+        The temperature to be used when querying the API.
+    additional_prompt_text: str | None = None
+        Any additional text to be included in the prompt, to fine-tune the response.
+    budget: BudgetGovernor | None = None
+        Used to record the tokens used by the requests, and to check there's
+        budget remaining before a repair request.
+    json_mode: bool = True
+        Whether to ask the model to only respond with a json object, set to False
+        for models that don't support it.
+    repair: bool = True
+        Whether to make one repair request if the response can't be parsed.
+    response_stats: ResponseStats | None = None
+        Used to count how the run's responses were parsed.
+    **_
+        Unused kwargs.
+
+    Returns
+    -------
+    IssueStatus
+        An object detailing the current status of the issue, along with a reason
+        and a comment that can be used to prompt the issue.
+    """
+    prompt = f"""
+The following is a JSON representation of a GitHub issue
+(with it's 5 most recent comments) that I'd like to work on,
+but I'm not sure if someone else is already working on it!
+
+The issue: {dumps(issue.to_dict())}
+
+Can you tell me if the issue looks active, if work on it has gone stale,
+or if it's free to work on?
+
+Provide a reason, and also a comment I can post on the issue to prompt
+any users I may need to in order to begin work on it.
+
+Give your response as a JSON object, in the following example format,
+where the status is one of "active", "stale" or "free":
+{{
+    "status": "stale",
+    "reason": "This is a reason for why the issue is in the current status.",
+    "comment": "This is a comment to post on the issue."
+}}
+
+{additional_prompt_text or ""}
+"""
+    response_format = {"type": "json_object"} if json_mode else None
+
+    response = _complete(
+        client=client,
+        organisation=issue.organisation,
+        prompt=prompt,
+        budget=budget,
+        model=model,
+        temperature=temperature,
+        max_tokens=max_tokens,
+        **({"response_format": response_format} if response_format else {}),
+    )
+
+    response_dict, salvaged = _parse_response(response=response)
+    if (status := _issue_status(response_dict=response_dict)) is not None:
+        if response_stats is not None:
+            response_stats.count("salvaged" if salvaged else "parsed")
+        return status
+
+    if repair and budget is not None:
+        try:
+            budget.check(organisation=issue.organisation)
+        except BudgetExhaustedError:
+            logger.info("Not repairing the response for issue %s, over budget.", issue)
+            repair = False
+
+    if repair:
+        # a short prompt with only the broken response, so the retry is cheap
+        logger.debug("Repairing the response for issue %s: %s", issue, response)
+        repaired = _complete(
+            client=client,
+            organisation=issue.organisation,
+            prompt=_REPAIR_PROMPT.format(response=response),
+            budget=budget,
+            model=model,
+            temperature=0,
+            max_tokens=max_tokens,
+            **({"response_format": response_format} if response_format else {}),
+        )
+        repaired_dict, _salvaged = _parse_response(response=repaired)
+        if (status := _issue_status(response_dict=repaired_dict)) is not None:
+            if response_stats is not None:
+                response_stats.count("repaired")
+            return status
+
+    if response_stats is not None:
+        response_stats.count("failed")
+    logger.error(
+        "Hit an error parsing the response returned by the OpenAI API for issue %s. "
+        "Response string: %s.",
+        issue,
+        response,
+    )
+    return IssueStatus(status=Status.ERROR)
@@ -1,6 +1,8 @@
-from dataclasses import dataclass
+import threading
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from enum import Enum
+from typing import Any
 
 
 class _StrEnum(Enum):
@@ -17,6 +19,7 @@ class _StrEnum(Enum):
 class IssueCheckMode(_StrEnum):
     SIMPLE = "simple"
     AI = "ai"
+    LOCAL = "local"
 
 
 class PostCommentsOptions(_StrEnum):
@@ -26,6 +29,17 @@ class PostCommentsOptions(_StrEnum):
     ALL = "all"
 
 
+class BudgetExhaustedAction(_StrEnum):
+    STOP = "stop"
+    SIMPLE = "simple"
+
+
+class ResultSource(_StrEnum):
+    CHECKED = "checked"
+    CHECKPOINT = "checkpoint"
+    DUPLICATE = "duplicate"
+
+
 class Status(_StrEnum):
     ACTIVE = "active"
     STALE = "stale"
@@ -73,3 +87,81 @@ class Issue:
     @property
     def assignees_str(self):
         return ", ".join([f"@{_a}" for _a in self.assignees])
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the issue to a json serialisable dictionary."""
+        data = asdict(self)
+        data["created"] = self.created.isoformat()
+        data["updated"] = self.updated.isoformat()
+        for _c in data["comments"]:
+            _c["updated"] = _c["updated"].isoformat()
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "Issue":
+        """Create an issue from a dictionary created by `to_dict`."""
+        return cls(
+            **{
+                **data,
+                "created": datetime.fromisoformat(data["created"]),
+                "updated": datetime.fromisoformat(data["updated"]),
+                "comments": [
+                    IssueComment(
+                        **{**_c, "updated": datetime.fromisoformat(_c["updated"])}
+                    )
+                    for _c in data["comments"]
+                ],
+            }
+        )
+
+
+@dataclass
+class IssueResult:
+    """Class to store the result of checking an issue's status."""
+
+    issue: Issue
+    status: IssueStatus
+    mode: IssueCheckMode
+    source: ResultSource  # how the status was found, e.g. checked or from a checkpoint
+    started: datetime
+    duration: float  # seconds taken to find the status
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the result to a flat, json serialisable dictionary."""
+        return {
+            "issue": repr(self.issue),
+            "organisation": self.issue.organisation,
+            "repository": self.issue.repository,
+            "number": self.issue.number,
+            "status": str(self.status.status),
+            "reason": self.status.reason,
+            "comment": self.status.comment,
+            "mode": str(self.mode),
+            "source": str(self.source),
+            "started": self.started.isoformat(),
+            "duration": self.duration,
+            "data": self.issue.to_dict(),
+        }
+
+
+@dataclass
+class ResponseStats:
+    """Class to count how the responses of the OpenAI API were parsed."""
+
+    responses: int = 0
+    parsed: int = 0  # valid json first time
+    salvaged: int = 0  # near-json, fixed without another request
+    repaired: int = 0  # fixed by a repair request
+    failed: int = 0  # couldn't be fixed, so the issue's status is an error
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def count(self, outcome: str) -> None:
+        with self._lock:
+            self.responses += 1
+            setattr(self, outcome, getattr(self, outcome) + 1)
+
+    def __str__(self) -> str:
+        return (
+            f"{self.responses} responses ({self.parsed} parsed, {self.salvaged} salvaged, "
+            f"{self.repaired} repaired, {self.failed} failed)"
+        )
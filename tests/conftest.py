@@ -0,0 +1,71 @@
+from datetime import datetime, timedelta
+from typing import Any
+
+import pytest
+
+from github_issue_prompter import prompter
+from github_issue_prompter.types import Issue, IssueComment
+
+
+@pytest.fixture
+def make_issue():
+    """Factory for issue's, with any field overridden by keyword argument."""
+
+    def _make_issue(number: int = 1, days_old: int = 60, **kwargs) -> Issue:
+        created = datetime(2024, 1, 1) - timedelta(days=days_old)
+        fields: dict[str, Any] = {
+            "organisation": "org",
+            "repository": "repo",
+            "number": number,
+            "title": "Issue title",
+            "author": "author",
+            "body": "The issue body.",
+            "created": created,
+            "updated": created,
+            "assignees": [],
+            "comments": [],
+        }
+        fields.update(kwargs)
+        return Issue(**fields)
+
+    return _make_issue
+
+
+@pytest.fixture
+def make_comment():
+    """Factory for issue comments."""
+
+    def _make_comment(author: str = "someone", body: str = "+1", days_old: int = 30):
+        return IssueComment(
+            author=author,
+            body=body,
+            updated=datetime(2024, 1, 1) - timedelta(days=days_old),
+        )
+
+    return _make_comment
+
+
+@pytest.fixture
+def github(monkeypatch):
+    """
+    Stub the GitHub queries, returning the issue's added to the fixture by org/repo.
+
+    e.g. `github["org/repo"] = [issue, ...]`
+    """
+    repositories: dict[str, list[Issue]] = {}
+
+    def _get_repository_list(organisation: str, on_page=None, **_) -> list[str]:
+        names = [_r.split("/")[1] for _r in repositories if _r.startswith(organisation)]
+        if on_page:
+            on_page(names, None, False)
+        return names
+
+    def _get_issue_list(organisation: str, repository: str, on_page=None, **_):
+        issues = repositories.get(f"{organisation}/{repository}", [])
+        if on_page:
+            on_page(issues, None, False)
+        return issues
+
+    monkeypatch.setattr(prompter, "get_repository_list", _get_repository_list)
+    monkeypatch.setattr(prompter, "get_issue_list", _get_issue_list)
+    return repositories
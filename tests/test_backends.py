@@ -0,0 +1,71 @@
+import subprocess
+import sys
+
+import pytest
+
+from github_issue_prompter import backends
+from github_issue_prompter.backends import Backend, get_backend, load, register_backend
+from github_issue_prompter.prompter import get_status_client
+from github_issue_prompter.status import _check_simple, check_issue_status
+from github_issue_prompter.types import IssueCheckMode, IssueStatus, Status
+
+
+def test_command_imports_lazily():
+    # a fresh interpreter, so modules imported by other tests don't count
+    loaded = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, github_issue_prompter.command; print(' '.join(sys.modules))",
+        ],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout.split()
+
+    assert "github_issue_prompter.command" in loaded
+    assert "openai" not in loaded
+    assert "github_issue_prompter.status_ai" not in loaded
+    assert "github_issue_prompter.classifier" not in loaded
+
+
+def test_get_backend():
+    assert get_backend(mode=IssueCheckMode.AI).client is not None
+    assert get_backend(mode="simple") == Backend(
+        check="github_issue_prompter.status:_check_simple"
+    )
+
+    with pytest.raises(ValueError):
+        get_backend(mode="unknown")
+
+
+def test_load():
+    assert load("github_issue_prompter.status:_check_simple") is _check_simple
+
+
+@pytest.mark.parametrize("modes", [[], ["simple"], ["local"], ["simple", "local"]])
+def test_get_status_client_without_client(modes, monkeypatch):
+    monkeypatch.delenv("PROMPTER_OPENAI_TOKEN", raising=False)
+    assert get_status_client(modes=[IssueCheckMode(_m) for _m in modes]) is None
+
+
+def test_get_status_client_needs_token(monkeypatch):
+    monkeypatch.delenv("PROMPTER_OPENAI_TOKEN", raising=False)
+    with pytest.raises(ValueError, match="OpenAI API key"):
+        get_status_client(modes=[IssueCheckMode.SIMPLE, IssueCheckMode.AI])
+
+
+def test_register_backend(monkeypatch, make_issue):
+    monkeypatch.setattr(backends, "_BACKENDS", dict(backends._BACKENDS))
+    register_backend(
+        mode=IssueCheckMode.LOCAL,
+        backend=Backend(check=f"{__name__}:_check_always_free"),
+    )
+
+    status = check_issue_status(issue=make_issue(), mode=IssueCheckMode.LOCAL)
+
+    assert status.status == Status.FREE
+
+
+def _check_always_free(**_) -> IssueStatus:
+    return IssueStatus(status=Status.FREE)
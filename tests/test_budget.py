@@ -0,0 +1,71 @@
+import time
+
+import pytest
+
+from github_issue_prompter.budget import (
+    BudgetExhaustedError,
+    BudgetGovernor,
+    BudgetLimits,
+)
+
+
+def test_check_within_budget():
+    budget = BudgetGovernor(run_limits=BudgetLimits(max_tokens=100, max_requests=2))
+    budget.record(organisation="org", prompt_tokens=50, completion_tokens=10)
+
+    budget.check(organisation="org")  # doesn't raise
+
+
+def test_check_run_tokens():
+    budget = BudgetGovernor(run_limits=BudgetLimits(max_tokens=100))
+    budget.record(organisation="org", prompt_tokens=90, completion_tokens=10)
+
+    with pytest.raises(BudgetExhaustedError, match="token limit") as error:
+        budget.check(organisation="other")
+    assert error.value.organisation is None
+
+
+def test_check_requests_without_usage():
+    budget = BudgetGovernor(run_limits=BudgetLimits(max_requests=1))
+    budget.record(organisation="org")  # the response didn't report its usage
+
+    assert budget.spend.requests == 1
+    with pytest.raises(BudgetExhaustedError, match="request limit"):
+        budget.check(organisation="org")
+
+
+def test_check_organisation():
+    budget = BudgetGovernor(organisation_limits=BudgetLimits(max_requests=1))
+    budget.record(organisation="org", prompt_tokens=10, completion_tokens=10)
+
+    with pytest.raises(BudgetExhaustedError) as error:
+        budget.check(organisation="org")
+    assert error.value.organisation == "org"
+
+    budget.check(organisation="other")  # other organisations have their own budget
+
+
+def test_check_warns_once(caplog):
+    budget = BudgetGovernor(run_limits=BudgetLimits(max_requests=0))
+
+    for _ in range(3):
+        with pytest.raises(BudgetExhaustedError):
+            budget.check(organisation="org")
+
+    assert caplog.text.count("The run has reached its request limit") == 1
+
+
+def test_clock_starts_on_first_use(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    budget = BudgetGovernor(run_limits=BudgetLimits(max_seconds=10))
+
+    # e.g. querying GitHub before the first ai request isn't counted
+    now[0] = 100.0
+    budget.check(organisation="org")
+    assert budget.spend.started == 100.0
+    assert budget.organisation_spend["org"].started == 100.0
+
+    now[0] = 105.0
+    assert budget.spend.seconds == 5.0
+    budget.check(organisation="org")  # still within the time limit
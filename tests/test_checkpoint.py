@@ -0,0 +1,65 @@
+import pytest
+
+from github_issue_prompter.checkpoint import Checkpoint
+from github_issue_prompter.types import IssueStatus, Status
+
+
+RUN = {"organisation": "org", "repository": None, "mode": "simple"}
+
+
+def test_resume(tmp_path, make_issue):
+    path = tmp_path / "checkpoint.jsonl"
+    issues = [make_issue(number=1), make_issue(number=2)]
+
+    checkpoint = Checkpoint(path=path, run=RUN)
+    checkpoint.record_repositories(
+        organisation="org", names=["repo"], cursor="abc", has_next_page=False
+    )
+    checkpoint.record_issues(
+        repository="org/repo", issues=issues, cursor="def", has_next_page=True
+    )
+    checkpoint.record_result(issue=issues[0], status=IssueStatus(status=Status.ACTIVE))
+
+    resumed = Checkpoint(path=path, run=RUN, resume=True)
+
+    assert resumed.repositories["org"] == {
+        "names": ["repo"],
+        "cursor": "abc",
+        "done": True,
+    }
+    assert resumed.issues["org/repo"]["issues"] == issues
+    assert resumed.issues["org/repo"]["cursor"] == "def"
+    assert not resumed.issues["org/repo"]["done"]
+    assert resumed.results == {"org/repo/issues/1": IssueStatus(status=Status.ACTIVE)}
+
+
+def test_resume_different_run(tmp_path):
+    path = tmp_path / "checkpoint.jsonl"
+    Checkpoint(path=path, run=RUN)
+
+    with pytest.raises(ValueError, match="different run"):
+        Checkpoint(path=path, run={**RUN, "mode": "ai"}, resume=True)
+
+
+def test_resume_missing(tmp_path):
+    with pytest.raises(ValueError, match="no checkpoint"):
+        Checkpoint(path=tmp_path / "checkpoint.jsonl", run=RUN, resume=True)
+
+
+def test_resume_torn_line(tmp_path, make_issue):
+    path = tmp_path / "checkpoint.jsonl"
+    first, second = make_issue(number=1), make_issue(number=2)
+
+    checkpoint = Checkpoint(path=path, run=RUN)
+    checkpoint.record_result(issue=first, status=IssueStatus(status=Status.ACTIVE))
+    with path.open("a") as file:
+        file.write('{"type": "result", "data": {"iss')  # killed mid-write
+
+    resumed = Checkpoint(path=path, run=RUN, resume=True)
+    assert list(resumed.results) == ["org/repo/issues/1"]
+    resumed.record_result(issue=second, status=IssueStatus(status=Status.STALE))
+
+    # the result recorded after the torn line survives another resume
+    resumed = Checkpoint(path=path, run=RUN, resume=True)
+    assert list(resumed.results) == ["org/repo/issues/1", "org/repo/issues/2"]
+    assert resumed.results["org/repo/issues/2"].status == Status.STALE
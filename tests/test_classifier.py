@@ -0,0 +1,58 @@
+from datetime import datetime
+
+import pytest
+
+from github_issue_prompter.classifier import _check_local, train_local_classifier
+from github_issue_prompter.sinks import JSONLSink
+from github_issue_prompter.types import (
+    IssueCheckMode,
+    IssueResult,
+    IssueStatus,
+    ResultSource,
+    Status,
+)
+
+
+@pytest.fixture
+def results(tmp_path, make_issue, make_comment):
+    """A results file of ai verdicts: assigned issue's with recent comments are active."""
+    path = tmp_path / "results.jsonl"
+    sink = JSONLSink(path)
+    for number in range(40):
+        active = number % 2 == 0
+        issue = make_issue(
+            number=number,
+            assignees=["someone"] if active else [],
+            comments=[make_comment(author="someone", days_old=1)] if active else [],
+        )
+        sink.write(
+            IssueResult(
+                issue=issue,
+                status=IssueStatus(status=Status.ACTIVE if active else Status.FREE),
+                mode=IssueCheckMode.AI,
+                source=ResultSource.CHECKED,
+                started=datetime(2024, 1, 1),
+                duration=1.0,
+            )
+        )
+    sink.close()
+    return path
+
+
+def test_train_local_classifier(tmp_path, results, make_issue):
+    model_path = tmp_path / "model.json"
+
+    agreement = train_local_classifier(results=results, model_path=model_path)
+
+    assert agreement == 1.0
+    status = _check_local(issue=make_issue(number=100), model_path=model_path)
+    assert status.status == Status.FREE
+    assert status.comment is not None
+
+
+@pytest.mark.parametrize("holdout", [0.0, 1.0, 1.5])
+def test_train_local_classifier_holdout(tmp_path, results, holdout):
+    with pytest.raises(ValueError, match="holdout"):
+        train_local_classifier(
+            results=results, model_path=tmp_path / "model.json", holdout=holdout
+        )
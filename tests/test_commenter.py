@@ -0,0 +1,129 @@
+import json
+from datetime import datetime, timedelta
+
+import requests
+
+from github_issue_prompter import commenter
+from github_issue_prompter.commenter import CommentJournal, CommentPoster
+
+
+def test_journal_records_posted(tmp_path, make_issue):
+    path = tmp_path / "comments.jsonl"
+    issue = make_issue()
+
+    journal = CommentJournal(path)
+    assert not journal.has_posted(issue)
+    journal.record(issue=issue, comment="hello", state="posted")
+
+    assert CommentJournal(path).has_posted(issue)
+    assert not CommentJournal(path).has_posted(make_issue(number=2))
+
+
+def test_journal_failed_can_be_retried(tmp_path, make_issue):
+    path = tmp_path / "comments.jsonl"
+    issue = make_issue()
+
+    journal = CommentJournal(path)
+    journal.record(issue=issue, comment="hello", state="pending")
+    journal.record(issue=issue, comment="hello", state="failed")
+
+    assert not CommentJournal(path).has_posted(issue)
+
+
+def test_journal_torn_line(tmp_path, make_issue):
+    path = tmp_path / "comments.jsonl"
+    first, torn = make_issue(number=1), make_issue(number=2)
+
+    CommentJournal(path).record(issue=first, comment="hello", state="posted")
+    with path.open("a") as file:
+        file.write(f'{{"issue": "{torn!r}", "hash": "ab')
+
+    journal = CommentJournal(path)
+    assert journal.has_posted(first)
+    assert journal.has_posted(torn)  # may have been posted, so treated as pending
+
+    # the torn line is removed, so new entries are readable
+    journal.record(issue=make_issue(number=3), comment="hello", state="posted")
+    lines = path.read_text().splitlines()
+    assert [json.loads(_l)["issue"] for _l in lines] == [
+        repr(first),
+        "org/repo/issues/3",
+    ]
+
+
+def test_poster_skips_journaled(tmp_path, make_issue, monkeypatch):
+    posted = []
+    monkeypatch.setattr(
+        commenter,
+        "comment_on_github_issue",
+        lambda issue, **_: posted.append(repr(issue)) or True,
+    )
+    journal = CommentJournal(tmp_path / "comments.jsonl")
+    journal.record(issue=make_issue(number=1), comment="hello", state="posted")
+
+    with CommentPoster(token="token", journal=journal, min_interval=0) as poster:
+        poster.submit(issue=make_issue(number=1), comment="hello")
+        poster.submit(issue=make_issue(number=2), comment="hello")
+        poster.submit(issue=make_issue(number=2), comment="hello")
+
+    assert posted == ["org/repo/issues/2"]
+    assert (poster.posted, poster.skipped) == (1, 2)
+
+
+def test_poster_request_error(tmp_path, make_issue, monkeypatch):
+    def _raise(**_):
+        raise requests.ReadTimeout("timed out")
+
+    monkeypatch.setattr(commenter, "comment_on_github_issue", _raise)
+    journal = CommentJournal(tmp_path / "comments.jsonl")
+
+    with CommentPoster(token="token", journal=journal, min_interval=0) as poster:
+        assert poster.submit(issue=make_issue(), comment="hello").result() is False
+
+    assert poster.uncertain == 1
+    states = [json.loads(_l)["state"] for _l in journal.path.read_text().splitlines()]
+    assert states == ["pending", "uncertain"]
+    assert CommentJournal(journal.path).has_posted(make_issue())
+
+
+def test_poster_connect_error(tmp_path, make_issue, monkeypatch):
+    def _raise(**_):
+        raise requests.ConnectTimeout("couldn't connect")
+
+    monkeypatch.setattr(commenter, "comment_on_github_issue", _raise)
+    journal = CommentJournal(tmp_path / "comments.jsonl")
+
+    with CommentPoster(token="token", journal=journal, min_interval=0) as poster:
+        poster.submit(issue=make_issue(), comment="hello")
+
+    assert poster.failed == 1
+    assert not CommentJournal(journal.path).has_posted(make_issue())
+
+
+def test_poster_logs_unexpected_error(tmp_path, make_issue, monkeypatch, caplog):
+    def _raise(**_):
+        raise RuntimeError("unexpected")
+
+    monkeypatch.setattr(commenter, "comment_on_github_issue", _raise)
+
+    with CommentPoster(token="token", min_interval=0) as poster:
+        poster.submit(issue=make_issue(), comment="hello")
+
+    assert "Unexpected error posting a comment" in caplog.text
+
+
+def test_journal_window(tmp_path, make_issue):
+    path = tmp_path / "comments.jsonl"
+    issue = make_issue()
+    entry = {
+        "issue": repr(issue),
+        "hash": "ab",
+        "state": "posted",
+        "time": (datetime.now() - timedelta(days=40)).isoformat(),
+    }
+    path.write_text(json.dumps(entry) + "\n")
+
+    # commented on 40 days ago, so can be commented on again after a 30 day window
+    assert not CommentJournal(path).has_posted(issue)
+    assert CommentJournal(path, window=timedelta(days=60)).has_posted(issue)
+    assert CommentJournal(path, window=None).has_posted(issue)
@@ -0,0 +1,72 @@
+from github_issue_prompter.dedupe import DuplicateIndex
+from github_issue_prompter.types import IssueStatus, Status
+
+
+BODY = "When I run the training script with a large batch size the process crashes."
+
+
+def test_duplicate_of_active(make_issue):
+    index = DuplicateIndex()
+    original = make_issue(number=1, body=BODY)
+    index.add(issue=original, status=IssueStatus(status=Status.ACTIVE, reason="Busy."))
+
+    status = index.duplicate_status(issue=make_issue(number=2, body=BODY))
+
+    assert status is not None
+    assert status.status == Status.ACTIVE
+    assert "org/repo/issues/1" in status.reason
+
+
+def test_not_duplicate(make_issue):
+    index = DuplicateIndex()
+    index.add(issue=make_issue(number=1, body=BODY), status=IssueStatus(Status.ACTIVE))
+
+    other = make_issue(number=2, title="Docs", body="Typo in the installation guide.")
+    assert index.duplicate_status(issue=other) is None
+
+
+def test_duplicate_in_different_state(make_issue):
+    index = DuplicateIndex()
+    index.add(issue=make_issue(number=1, body=BODY), status=IssueStatus(Status.ACTIVE))
+
+    # the duplicate is assigned, so needs checking itself
+    duplicate = make_issue(number=2, body=BODY, assignees=["someone"])
+    assert index.find(issue=duplicate) is not None
+    assert index.duplicate_status(issue=duplicate) is None
+
+
+def test_duplicate_of_stale(make_issue):
+    index = DuplicateIndex()
+    index.add(
+        issue=make_issue(number=1, body=BODY, assignees=["someone"]),
+        status=IssueStatus(Status.STALE, reason="Quiet.", comment="Hey @someone"),
+    )
+
+    status = index.duplicate_status(
+        issue=make_issue(number=2, body=BODY, assignees=["other"])
+    )
+
+    # the comment is addressed to the duplicate's own assignees
+    assert status is not None
+    assert status.status == Status.STALE
+    assert status.comment is not None and "@other" in status.comment
+
+
+def test_duplicate_of_free(make_issue):
+    index = DuplicateIndex()
+    index.add(issue=make_issue(number=1, body=BODY), status=IssueStatus(Status.FREE))
+
+    status = index.duplicate_status(
+        issue=make_issue(number=2, body=BODY, author="reporter")
+    )
+
+    assert status is not None
+    assert status.status == Status.FREE
+    assert status.comment == "Hey @reporter, mind if I take on this issue?"
+
+
+def test_duplicate_of_error(make_issue):
+    index = DuplicateIndex()
+    index.add(issue=make_issue(number=1, body=BODY), status=IssueStatus(Status.ERROR))
+
+    assert index.duplicate_status(issue=make_issue(number=2, body=BODY)) is None
@@ -0,0 +1,109 @@
+import pytest
+
+from github_issue_prompter.manifest import (
+    Manifest,
+    ManifestTarget,
+    load_manifest,
+    prompt_manifest,
+)
+from github_issue_prompter.sinks import CallbackSink
+from github_issue_prompter.types import IssueCheckMode
+
+
+def test_load_manifest(tmp_path):
+    path = tmp_path / "targets.json"
+    path.write_text(
+        '{"defaults": {"mode": "simple"}, "targets": ['
+        '{"organisation": "org", "repository": "repo", "options": {"model": "gpt-4"}},'
+        '{"organisation": "other", "prompt_count": 2}'
+        "]}"
+    )
+
+    manifest = load_manifest(path)
+
+    assert [t.organisation for t in manifest.targets] == ["org", "other"]
+    assert manifest.targets[0].repositories == ["repo"]
+    assert manifest.targets[0].options == {"model": "gpt-4"}
+    assert manifest.targets[1].mode == IssueCheckMode.SIMPLE
+    assert manifest.targets[1].prompt_count == 2
+    assert manifest.targets[1].options == {}
+
+
+def test_load_manifest_unknown_option(tmp_path):
+    path = tmp_path / "targets.json"
+    path.write_text('{"targets": [{"organisation": "org", "prompt_cont": 3}]}')
+
+    with pytest.raises(ValueError, match="prompt_cont"):
+        load_manifest(path)
+
+
+def test_prompt_manifest(github, make_issue):
+    # issue numbers give the creation order, lower numbers are older
+    github["org/repo"] = [
+        make_issue(number=_n, days_old=100 - _n) for _n in range(1, 6)
+    ]
+    github["other/repo"] = [
+        make_issue(organisation="other", number=_n, days_old=100 - _n)
+        for _n in range(1, 6)
+    ]
+    manifest = Manifest(
+        targets=[
+            ManifestTarget(
+                organisation="org", repositories=["repo"], mode="simple", prompt_count=2
+            ),
+            ManifestTarget(
+                organisation="other",
+                repositories=["repo"],
+                mode="simple",
+                prompt_count=5,
+                priority=10,
+            ),
+        ],
+        max_prompts=6,
+    )
+
+    results = []
+    prompt_manifest(
+        manifest=manifest, github_token="token", sinks=[CallbackSink(results.append)]
+    )
+
+    # the higher priority target first, then up to the lower target's prompt_count,
+    # stopping once max_prompts issues have been found overall
+    assert [repr(_r.issue) for _r in results] == [
+        "other/repo/issues/1",
+        "other/repo/issues/2",
+        "other/repo/issues/3",
+        "other/repo/issues/4",
+        "other/repo/issues/5",
+        "org/repo/issues/1",
+    ]
+
+
+def test_prompt_manifest_prompt_count(github, make_issue):
+    github["org/repo"] = [
+        make_issue(number=_n, days_old=100 - _n) for _n in range(1, 6)
+    ]
+    manifest = Manifest(
+        targets=[
+            ManifestTarget(
+                organisation="org", repositories=["repo"], mode="simple", prompt_count=2
+            ),
+        ],
+    )
+
+    results = []
+    prompt_manifest(
+        manifest=manifest, github_token="token", sinks=[CallbackSink(results.append)]
+    )
+
+    assert [repr(_r.issue) for _r in results] == [
+        "org/repo/issues/1",
+        "org/repo/issues/2",
+    ]
+
+
+def test_prompt_manifest_max_prompts(make_issue):
+    manifest = Manifest(targets=[ManifestTarget(organisation="org", mode="simple")])
+
+    with pytest.raises(ValueError, match="Maximum number of prompts"):
+        prompt_manifest(manifest=manifest, github_token="token", max_prompts=0)
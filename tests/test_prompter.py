@@ -0,0 +1,104 @@
+from datetime import datetime
+
+from github_issue_prompter import prompter
+from github_issue_prompter.prompter import iter_prompt_issues, prompt_issues
+from github_issue_prompter.sinks import CallbackSink
+from github_issue_prompter.types import (
+    IssueCheckMode,
+    IssueComment,
+    IssueResult,
+    IssueStatus,
+    ResultSource,
+    Status,
+)
+
+
+def test_iter_prompt_issues(github, make_issue):
+    # issue 2 has just been commented on, so is active, the others are free
+    comment = IssueComment(author="someone", body="On it!", updated=datetime.now())
+    github["org/repo"] = [
+        make_issue(number=1, days_old=30),
+        make_issue(number=2, days_old=20, comments=[comment]),
+        make_issue(number=3, days_old=10),
+    ]
+    written: list[IssueResult] = []
+
+    results = iter_prompt_issues(
+        organisation="org",
+        repository="repo",
+        github_token="token",
+        mode=IssueCheckMode.SIMPLE,
+        prompt_count=5,
+        sinks=[CallbackSink(written.append)],
+    )
+
+    # each result is written and yielded as soon as it's checked
+    first = next(results)
+    assert repr(first.issue) == "org/repo/issues/1"
+    assert written == [first]
+
+    rest = list(results)
+    assert [str(_r.status.status) for _r in rest] == ["active", "free"]
+    assert written == [first, *rest]
+    assert all(_r.source == ResultSource.CHECKED for _r in written)
+
+
+def test_prompt_issues_prompt_count(github, make_issue):
+    github["org/repo"] = [make_issue(number=_n, days_old=100 - _n) for _n in range(5)]
+    written: list[IssueResult] = []
+
+    prompt_issues(
+        organisation="org",
+        github_token="token",
+        mode=IssueCheckMode.SIMPLE,
+        prompt_count=2,
+        sinks=[CallbackSink(written.append)],
+    )
+
+    # stops once prompt_count issues are found, with the last one still written
+    assert [repr(_r.issue) for _r in written] == [
+        "org/repo/issues/0",
+        "org/repo/issues/1",
+    ]
+
+
+def test_prompt_issues_resume(tmp_path, github, make_issue):
+    github["org/repo"] = [make_issue(number=_n, days_old=100 - _n) for _n in range(5)]
+    checkpoint = tmp_path / "checkpoint.jsonl"
+    options = {
+        "organisation": "org",
+        "github_token": "token",
+        "mode": IssueCheckMode.SIMPLE,
+        "checkpoint": str(checkpoint),
+    }
+
+    prompt_issues(prompt_count=2, **options)
+
+    written: list[IssueResult] = []
+    github["org/repo"] = []  # resuming replays the queried issues from the checkpoint
+    prompt_issues(
+        prompt_count=3, resume=True, sinks=[CallbackSink(written.append)], **options
+    )
+
+    # replayed results are written to the sinks too, then checking continues
+    assert [(repr(_r.issue), _r.source) for _r in written] == [
+        ("org/repo/issues/0", ResultSource.CHECKPOINT),
+        ("org/repo/issues/1", ResultSource.CHECKPOINT),
+        ("org/repo/issues/2", ResultSource.CHECKED),
+    ]
+
+
+def test_prompt_issues_reports_spend(github, make_issue, monkeypatch, caplog):
+    github["org/repo"] = [make_issue()]
+    monkeypatch.setattr(prompter, "get_status_client", lambda **_: object())
+    monkeypatch.setattr(
+        prompter,
+        "check_issue_status",
+        lambda **_: IssueStatus(status=Status.ACTIVE),
+    )
+    caplog.set_level("INFO")
+
+    prompt_issues(organisation="org", github_token="token", mode=IssueCheckMode.AI)
+
+    # no budget was given, but the ai mode's spend is still reported
+    assert "ai mode spend: 0 requests" in caplog.text
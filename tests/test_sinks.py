@@ -0,0 +1,54 @@
+from datetime import datetime
+
+import pytest
+
+from github_issue_prompter.sinks import CallbackSink, get_sink, load_results
+from github_issue_prompter.types import (
+    Issue,
+    IssueCheckMode,
+    IssueResult,
+    IssueStatus,
+    ResultSource,
+    Status,
+)
+
+
+@pytest.fixture
+def result(make_issue, make_comment):
+    return IssueResult(
+        issue=make_issue(assignees=["someone"], comments=[make_comment()]),
+        status=IssueStatus(status=Status.STALE, reason="Quiet.", comment="Hi!"),
+        mode=IssueCheckMode.AI,
+        source=ResultSource.CHECKED,
+        started=datetime(2024, 1, 1, 12),
+        duration=1.5,
+    )
+
+
+@pytest.mark.parametrize("name", ["results.jsonl", "results.db", "results.sqlite"])
+def test_round_trip(tmp_path, result, name):
+    sink = get_sink(tmp_path / name)
+    sink.write(result=result)
+    sink.write(result=result)
+    sink.close()
+
+    loaded = load_results(tmp_path / name)
+
+    assert loaded == [result.to_dict(), result.to_dict()]
+    assert Issue.from_dict(loaded[0]["data"]) == result.issue
+
+
+def test_unsupported_file(tmp_path):
+    with pytest.raises(ValueError, match="Unsupported results file"):
+        get_sink(tmp_path / "results.csv")
+    with pytest.raises(ValueError, match="Unsupported results file"):
+        load_results(tmp_path / "results.csv")
+
+
+def test_callback_sink(result):
+    results: list[IssueResult] = []
+
+    with CallbackSink(results.append) as sink:
+        sink.write(result=result)
+
+    assert results == [result]
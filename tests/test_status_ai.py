@@ -0,0 +1,150 @@
+from types import SimpleNamespace
+
+import pytest
+
+from github_issue_prompter import prompter
+from github_issue_prompter.budget import BudgetGovernor, BudgetLimits
+from github_issue_prompter.status_ai import _check_ai, _parse_response
+from github_issue_prompter.types import IssueCheckMode, ResponseStats, Status
+
+
+VALID = '{"status": "free", "reason": "No one is working on it.", "comment": "Hi!"}'
+
+
+class FakeClient:
+    """Stands in for the OpenAI client, returning each response in turn."""
+
+    def __init__(self, *responses: str, usage: bool = True):
+        self.responses = list(responses)
+        self.usage = usage
+        self.requests: list[dict] = []
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    def create(self, **kwargs):
+        self.requests.append(kwargs)
+        return SimpleNamespace(
+            choices=[
+                SimpleNamespace(message=SimpleNamespace(content=self.responses.pop(0)))
+            ],
+            usage=(
+                SimpleNamespace(prompt_tokens=100, completion_tokens=20)
+                if self.usage
+                else None
+            ),
+        )
+
+
+def test_budget_records_usage(make_issue):
+    budget = BudgetGovernor()
+
+    _check_ai(issue=make_issue(), client=FakeClient(VALID), budget=budget)
+
+    assert budget.spend.requests == 1
+    assert budget.spend.total_tokens == 120
+    assert budget.organisation_spend["org"].requests == 1
+
+
+def test_budget_records_requests_without_usage(make_issue):
+    budget = BudgetGovernor()
+
+    _check_ai(issue=make_issue(), client=FakeClient(VALID, usage=False), budget=budget)
+
+    assert budget.spend.requests == 1
+    assert budget.spend.total_tokens == 0
+
+
+def test_budget_checked_before_repair(make_issue):
+    budget = BudgetGovernor(run_limits=BudgetLimits(max_requests=1))
+    client = FakeClient("not json", VALID)
+
+    status = _check_ai(issue=make_issue(), client=client, budget=budget)
+
+    assert status.status == Status.ERROR
+    assert len(client.requests) == 1  # no repair request, the budget was used up
+
+
+@pytest.mark.parametrize(
+    "response",
+    [
+        '```json\n{"status": "stale", "reason": "r", "comment": "c"}\n```',
+        'Sure! Here it is: {"status": "stale", "reason": "r", "comment": "c"} Thanks.',
+        '{"status": "stale", "reason": "r", "comment": "c",}',
+        "{'status': 'stale', 'reason': 'r', 'comment': 'c'}",
+    ],
+)
+def test_parse_response_salvaged(response):
+    assert _parse_response(response) == (
+        {"status": "stale", "reason": "r", "comment": "c"},
+        True,
+    )
+
+
+@pytest.mark.parametrize("response", [None, "", "not json", "[1, 2]", '{"status": '])
+def test_parse_response_invalid(response):
+    assert _parse_response(response) == (None, False)
+
+
+def test_check_ai_parsed(make_issue):
+    stats = ResponseStats()
+    client = FakeClient(VALID.replace("free", "Free"))
+
+    status = _check_ai(issue=make_issue(), client=client, response_stats=stats)
+
+    assert status.status == Status.FREE
+    assert status.comment == "Hi!"
+    assert client.requests[0]["response_format"] == {"type": "json_object"}
+    assert (stats.responses, stats.parsed) == (1, 1)
+
+
+def test_check_ai_repaired(make_issue):
+    stats = ResponseStats()
+    client = FakeClient('{"status": "free", "reason": "r", "comment": \'c."}', VALID)
+
+    status = _check_ai(issue=make_issue(), client=client, response_stats=stats)
+
+    assert status.status == Status.FREE
+    assert len(client.requests) == 2
+    assert client.requests[1]["temperature"] == 0
+    assert (stats.responses, stats.repaired) == (1, 1)
+
+
+def test_check_ai_failed(make_issue):
+    stats = ResponseStats()
+    client = FakeClient("not json", '{"status": "busy"}')
+
+    status = _check_ai(issue=make_issue(), client=client, response_stats=stats)
+
+    assert status.status == Status.ERROR
+    assert (stats.responses, stats.failed) == (1, 1)
+
+
+def test_check_ai_without_repair(make_issue):
+    client = FakeClient("not json")
+
+    status = _check_ai(issue=make_issue(), client=client, repair=False, json_mode=False)
+
+    assert status.status == Status.ERROR
+    assert len(client.requests) == 1
+    assert "response_format" not in client.requests[0]
+
+
+def test_response_stats_per_run(make_issue, monkeypatch, caplog):
+    monkeypatch.setattr(prompter, "query_issues", lambda **_: [make_issue()])
+    caplog.set_level("INFO")
+
+    for _ in range(2):
+        monkeypatch.setattr(
+            prompter, "get_status_client", lambda **_: FakeClient("not json", VALID)
+        )
+        list(
+            prompter.iter_prompt_issues(
+                organisation="org",
+                github_token="token",
+                mode=IssueCheckMode.AI,
+                comment_journal=None,
+            )
+        )
+
+    assert (
+        caplog.text.count("ai mode 1 responses (0 parsed, 0 salvaged, 1 repaired") == 2
+    )